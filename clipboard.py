@@ -5,6 +5,7 @@ Provides functionality to grab images from the clipboard
 and stage them as attachments for sending.
 """
 
+import io
 import os
 import tempfile
 from dataclasses import dataclass
@@ -18,6 +19,37 @@ try:
 except ImportError:
     HAS_PILLOW = False
 
+# Try to import NumPy for fast preview generation
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Resampling filter for ASCII previews. At a 40x8 target the output is
+# quantized to 5 shade levels, so BILINEAR is indistinguishable from
+# LANCZOS and considerably cheaper on large screenshots.
+if HAS_PILLOW:
+    PREVIEW_FILTER = Image.Resampling.BILINEAR
+
+# Temp directory never changes during a run; resolve it once
+_TEMP_DIR = tempfile.gettempdir()
+_CLIPBOARD_TEMP_PATH = os.path.join(_TEMP_DIR, "signal_tui_clipboard.png")
+
+# Extensions accepted without opening the file when the clipboard holds paths
+_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'}
+
+# Shade characters from brightest to darkest (inverted for dark terminal
+# backgrounds, which makes dark images more visible), plus a 256-entry
+# gray-value → character table so the per-pixel mapping is a single lookup
+_PREVIEW_CHARS = "█▓▒░ "
+_PREVIEW_CHAR_LUT = [
+    _PREVIEW_CHARS[min(len(_PREVIEW_CHARS) - 1, g * len(_PREVIEW_CHARS) // 256)]
+    for g in range(256)
+]
+if HAS_NUMPY:
+    _PREVIEW_CHAR_ARR = np.array(_PREVIEW_CHAR_LUT)
+
 
 @dataclass
 class StagedAttachment:
@@ -63,31 +95,31 @@ def generate_image_preview(image: "Image.Image", width: int = 40, height: int =
         return ""
 
     try:
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-
-        # Resize to target dimensions
-        thumb = image.resize((width, height), Image.Resampling.LANCZOS)
-        pixels = thumb.load()
-
-        # Characters from brightest to darkest (inverted for dark terminal backgrounds)
-        # This makes dark images more visible on dark terminals
-        chars = "█▓▒░ "
-
-        lines = []
-        for y in range(height):
-            line = ""
-            for x in range(width):
-                r, g, b = pixels[x, y]
-                # Convert to grayscale (0-255)
-                gray = int(0.299 * r + 0.587 * g + 0.114 * b)
-                # Map to character index (0-4)
-                idx = min(len(chars) - 1, gray * len(chars) // 256)
-                line += chars[idx]
-            lines.append(line)
-
-        return "\n".join(lines)
+        # Allow JPEG shrink-on-load when the source is file-backed
+        image.draft("L", (width * 4, height * 4))
+
+        # Resize to target dimensions, then let Pillow's C path convert
+        # straight to grayscale (ITU-R 601-2 luma). Going through an
+        # intermediate RGB image would just touch w*h*3 extra bytes —
+        # alpha is discarded for the luma preview anyway.
+        thumb = image.resize((width, height), PREVIEW_FILTER)
+        if thumb.mode != "L":
+            thumb = thumb.convert("L")
+
+        gray_bytes = thumb.tobytes()
+
+        if HAS_NUMPY:
+            # Vectorized path: one gather through the character table
+            gray = np.frombuffer(gray_bytes, dtype=np.uint8)
+            rows = _PREVIEW_CHAR_ARR[gray].reshape(height, width)
+            return "\n".join("".join(row) for row in rows)
+
+        # Fallback: table lookup per pixel over the raw gray plane
+        lut = _PREVIEW_CHAR_LUT
+        return "\n".join(
+            "".join(lut[b] for b in gray_bytes[y * width:(y + 1) * width])
+            for y in range(height)
+        )
     except Exception:
         return ""
 
@@ -119,26 +151,29 @@ def grab_clipboard_image() -> Optional[StagedAttachment]:
             # List of file paths - check if first is an image
             if image and os.path.isfile(image[0]):
                 file_path = image[0]
-                # Check if it's an image file
-                try:
-                    with Image.open(file_path) as img:
-                        # It's a valid image file, use it directly
-                        filename = os.path.basename(file_path)
-                        size = os.path.getsize(file_path)
-                        return StagedAttachment(
-                            path=file_path,
-                            filename=filename,
-                            size=size
-                        )
-                except Exception:
-                    return None
+
+                # Known image extensions can be staged without opening the
+                # file at all; everything else gets a cheap header check
+                # via verify(), which doesn't decode pixel data
+                ext = os.path.splitext(file_path)[1].lower()
+                if ext not in _IMAGE_EXTENSIONS:
+                    try:
+                        with Image.open(file_path) as img:
+                            img.verify()
+                    except Exception:
+                        return None
+
+                return StagedAttachment(
+                    path=file_path,
+                    filename=os.path.basename(file_path),
+                    size=os.path.getsize(file_path)
+                )
             return None
 
         # It's an actual image in the clipboard
         if isinstance(image, Image.Image):
             # Save to temp file
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(temp_dir, "signal_tui_clipboard.png")
+            temp_path = _CLIPBOARD_TEMP_PATH
 
             # Get dimensions before any conversion
             img_width, img_height = image.size
@@ -146,14 +181,14 @@ def grab_clipboard_image() -> Optional[StagedAttachment]:
             # Generate preview before saving
             preview = generate_image_preview(image)
 
-            # Convert to RGB if necessary (for RGBA images)
-            if image.mode == 'RGBA':
-                # Keep as PNG to preserve transparency
-                image.save(temp_path, 'PNG')
-            else:
-                image.save(temp_path, 'PNG')
-
-            size = os.path.getsize(temp_path)
+            # Encode to PNG in memory with light compression. The temp file
+            # is ephemeral (signal-cli re-encodes it on send), so trading
+            # ~20% size for a much faster deflate pass is a clear win on
+            # multi-MB screenshots. PNG preserves transparency for RGBA.
+            buf = io.BytesIO()
+            image.save(buf, 'PNG', compress_level=1, optimize=False)
+            size = buf.tell()
+            Path(temp_path).write_bytes(buf.getbuffer())
 
             return StagedAttachment(
                 path=temp_path,
@@ -182,8 +217,7 @@ def cleanup_temp_attachment(attachment: StagedAttachment) -> None:
         return
 
     try:
-        temp_dir = tempfile.gettempdir()
-        if attachment.path.startswith(temp_dir):
+        if attachment.path.startswith(_TEMP_DIR):
             if os.path.exists(attachment.path):
                 os.remove(attachment.path)
     except Exception:
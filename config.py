@@ -5,7 +5,7 @@ Configuration management for Signal TUI
 import json
 import os
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional
 
 
@@ -54,6 +54,7 @@ class ConfigManager:
 
     def __init__(self):
         self.config = Config()
+        self._last_saved_payload: Optional[str] = None
         self._ensure_config_dir()
         self.load()
 
@@ -68,15 +69,26 @@ class ConfigManager:
                 with open(self.CONFIG_FILE, "r") as f:
                     data = json.load(f)
                     self.config = Config(**data)
+                # Remember what's on disk so an unchanged save() is a no-op
+                self._last_saved_payload = json.dumps(self.config.__dict__, indent=2)
             except (json.JSONDecodeError, TypeError) as e:
                 # Invalid config, use defaults
                 pass
         return self.config
 
     def save(self) -> None:
-        """Save configuration to file."""
-        with open(self.CONFIG_FILE, "w") as f:
-            json.dump(asdict(self.config), f, indent=2)
+        """Save configuration to file (skipped when nothing changed)."""
+        payload = json.dumps(self.config.__dict__, indent=2)
+        if payload == self._last_saved_payload:
+            return
+
+        # Write to a temp file and replace atomically so a crash mid-write
+        # can't leave a truncated config.json behind
+        tmp_file = self.CONFIG_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "w") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.CONFIG_FILE)
+        self._last_saved_payload = payload
 
     def is_configured(self) -> bool:
         """Check if the app has been configured with an account."""
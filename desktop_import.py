@@ -10,7 +10,9 @@ import hashlib
 import json
 import subprocess
 import sys
+import time
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from typing import Optional, Callable
 
@@ -22,6 +24,13 @@ from cryptography.hazmat.backends import default_backend
 from signal_client import Message
 from message_store import MessageStore
 
+# Prefer orjson for the per-message parsing hot path during import
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class DesktopImportError(Exception):
     """Exception raised for desktop import errors."""
@@ -45,6 +54,13 @@ class SignalDesktopImporter:
     KEYCHAIN_SERVICE = "Signal Safe Storage"
     KEYCHAIN_ACCOUNT = "Signal Key"
 
+    # How many messages to buffer before each bulk insert during import
+    IMPORT_BATCH_SIZE = 1000
+
+    # PBKDF2-derived keys cached per (iterations, password) so repeated
+    # imports in one session don't re-run the KDF (1003 iterations on macOS)
+    _kdf_cache: dict[tuple[int, bytes], bytes] = {}
+
     def __init__(self, message_store: MessageStore, our_phone_number: str = ""):
         """
         Initialize the importer.
@@ -83,30 +99,36 @@ class SignalDesktopImporter:
         else:
             raise DesktopImportError(f"Unknown encryption version: {encrypted_data[:3]}")
 
-        # Derive key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA1(),
-            length=16,
-            salt=b"saltysalt",
-            iterations=iterations,
-            backend=default_backend()
-        )
-        derived_key = kdf.derive(password)
+        # Derive key using PBKDF2 (cached — the KDF dominates key acquisition)
+        cache_key = (iterations, password)
+        derived_key = self._kdf_cache.get(cache_key)
+        if derived_key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA1(),
+                length=16,
+                salt=b"saltysalt",
+                iterations=iterations,
+                backend=default_backend()
+            )
+            derived_key = kdf.derive(password)
+            self._kdf_cache[cache_key] = derived_key
 
         # Decrypt using AES-128-CBC with IV of 16 spaces
         iv = b" " * 16
         cipher = Cipher(algorithms.AES(derived_key), modes.CBC(iv), backend=default_backend())
         decryptor = cipher.decryptor()
 
-        # Skip the 3-byte version header
+        # Skip the 3-byte version header and decrypt into a preallocated
+        # buffer to avoid the update() + finalize() concatenation copy
         ciphertext = encrypted_data[3:]
-        decrypted = decryptor.update(ciphertext) + decryptor.finalize()
+        buf = bytearray(len(ciphertext) + 16)
+        n = decryptor.update_into(ciphertext, buf)
+        decryptor.finalize()
 
         # Remove PKCS#7 padding
-        padding_len = decrypted[-1]
-        decrypted = decrypted[:-padding_len]
+        padding_len = buf[n - 1]
 
-        return decrypted.decode("utf-8")
+        return bytes(buf[:n - padding_len]).decode("utf-8")
 
     def get_key_from_config(self) -> Optional[str]:
         """
@@ -127,8 +149,12 @@ class SignalDesktopImporter:
 
             # Try plain key first (old Signal Desktop versions)
             key = config.get("key")
-            if key and all(c in "0123456789abcdef" for c in key.lower()):
-                return key
+            if key:
+                try:
+                    bytes.fromhex(key)
+                    return key
+                except ValueError:
+                    pass
 
             # Try encrypted key (Signal Desktop 7.17+)
             encrypted_key = config.get("encryptedKey")
@@ -261,9 +287,40 @@ class SignalDesktopImporter:
             # Set the encryption key (hex format for raw key)
             cursor.execute(f"PRAGMA key = \"x'{self._key}'\"")
 
+            # Tune the connection for bulk read-only access. A large page
+            # cache keeps decrypted pages in memory across queries (SQLCipher
+            # decrypts per page, so cache misses cost AES work), mmap cuts
+            # read syscalls, and query_only skips journal/WAL setup.
+            cursor.execute("PRAGMA cache_size = -65536")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+            cursor.execute("PRAGMA mmap_size = 268435456")
+            cursor.execute("PRAGMA query_only = 1")
+
             # Verify connection by querying
             cursor.execute("SELECT count(*) FROM sqlite_master")
 
+            # Make sure per-conversation message queries can run as ordered
+            # index scans; older Signal Desktop schemas lack a suitable index.
+            # The index is best-effort: the DB is usually locked by a running
+            # Signal Desktop, and failing to create it must not abort the
+            # import — queries just fall back to sorting.
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type = 'index' AND tbl_name = 'messages'
+                  AND sql LIKE '%conversationId%sent_at%'
+            """)
+            if cursor.fetchone() is None:
+                try:
+                    cursor.execute("PRAGMA query_only = 0")
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_tui_conv_sent
+                        ON messages(conversationId, sent_at)
+                    """)
+                except sqlcipher.Error:
+                    pass
+                finally:
+                    cursor.execute("PRAGMA query_only = 1")
+
         except Exception as e:
             if "file is not a database" in str(e).lower():
                 raise DesktopImportError(
@@ -325,20 +382,23 @@ class SignalDesktopImporter:
 
         return conversations
 
-    def get_messages_for_conversation(
+    def iter_messages_for_conversation(
         self,
         conversation_internal_id: str,
         limit: Optional[int] = None
-    ) -> list[dict]:
+    ):
         """
-        Get messages for a specific conversation.
+        Iterate messages for a specific conversation.
+
+        Streams rows from the cursor instead of materializing the whole
+        history, so memory stays bounded on large conversations.
 
         Args:
             conversation_internal_id: The internal conversation ID
             limit: Maximum number of messages to retrieve (None for all)
 
-        Returns:
-            List of message dicts
+        Yields:
+            Message dicts
         """
         if not self._conn:
             self.connect()
@@ -357,7 +417,9 @@ class SignalDesktopImporter:
                     sent_at,
                     received_at,
                     hasAttachments,
-                    json
+                    CASE WHEN hasAttachments
+                         THEN json_extract(json, '$.attachments')
+                         ELSE NULL END
                 FROM messages
                 WHERE conversationId = ?
                 ORDER BY sent_at ASC
@@ -374,40 +436,64 @@ class SignalDesktopImporter:
                     sent_at,
                     received_at,
                     hasAttachments,
-                    json
+                    CASE WHEN hasAttachments
+                         THEN json_extract(json, '$.attachments')
+                         ELSE NULL END
                 FROM messages
                 WHERE conversationId = ?
                 ORDER BY sent_at ASC
             """, (conversation_internal_id,))
 
-        messages = []
-        for row in cursor.fetchall():
-            # Parse attachments from JSON if present
-            attachments = []
-            if row[7] and row[8]:  # hasAttachments and json
-                try:
-                    msg_json = json.loads(row[8])
-                    for att in msg_json.get("attachments", []):
-                        attachments.append({
-                            "contentType": att.get("contentType", ""),
-                            "filename": att.get("fileName", ""),
-                            "size": att.get("size", 0),
-                        })
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        for row in cursor:
+            yield self._row_to_message_dict(row)
 
-            messages.append({
-                "id": row[0],
-                "conversation_id": row[1],
-                "source": row[2],
-                "type": row[3],  # "incoming" or "outgoing"
-                "body": row[4] or "",
-                "sent_at": row[5],
-                "received_at": row[6],
-                "attachments": attachments
-            })
+    @staticmethod
+    def _parse_attachments(atts_json) -> list:
+        """Parse the extracted attachments array, or return [] if absent.
+
+        The queries extract only the attachments array (via json_extract)
+        and only for rows where hasAttachments is set, so attachment-free
+        messages never touch the full message JSON payload.
+        """
+        attachments = []
+        if atts_json:
+            try:
+                for att in _json_loads(atts_json):
+                    attachments.append({
+                        "contentType": att.get("contentType", ""),
+                        "filename": att.get("fileName", ""),
+                        "size": att.get("size", 0),
+                    })
+            except (ValueError, TypeError):
+                pass
+        return attachments
+
+    @classmethod
+    def _row_to_message_dict(cls, row) -> dict:
+        """Convert a raw messages-table row into a message dict."""
+        return {
+            "id": row[0],
+            "conversation_id": row[1],
+            "source": row[2],
+            "type": row[3],  # "incoming" or "outgoing"
+            "body": row[4] or "",
+            "sent_at": row[5],
+            "received_at": row[6],
+            "attachments": cls._parse_attachments(row[8])
+        }
 
-        return messages
+    def get_messages_for_conversation(
+        self,
+        conversation_internal_id: str,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """
+        Get messages for a specific conversation as a list.
+
+        Thin wrapper around iter_messages_for_conversation for callers
+        that want the full history at once.
+        """
+        return list(self.iter_messages_for_conversation(conversation_internal_id, limit))
 
     def import_all(
         self,
@@ -427,59 +513,90 @@ class SignalDesktopImporter:
             self.connect()
 
         conversations = self.get_conversations()
+        conv_by_internal_id = {c["internal_id"]: c for c in conversations}
         total_convs = len(conversations)
         total_messages = 0
         conv_count = 0
 
-        for i, conv in enumerate(conversations):
-            if progress_callback:
-                progress_callback(conv["name"], i + 1, total_convs)
-
-            # Get all messages for this conversation
-            messages = self.get_messages_for_conversation(conv["internal_id"])
-
-            # Convert to Message objects and prepare for bulk insert
-            messages_to_insert = []
-            for msg_data in messages:
-                # Determine if outgoing
-                is_outgoing = msg_data["type"] == "outgoing"
-
-                # Create timestamp
-                timestamp_ms = msg_data["sent_at"] or msg_data["received_at"] or 0
-                if timestamp_ms:
-                    timestamp = datetime.fromtimestamp(timestamp_ms / 1000)
-                else:
-                    timestamp = datetime.now()
-
-                msg = Message(
-                    sender=msg_data["source"] or (self.our_phone_number if is_outgoing else ""),
-                    sender_name="You" if is_outgoing else "",
-                    body=msg_data["body"],
-                    timestamp=timestamp,
-                    is_outgoing=is_outgoing,
-                    group_id=conv["id"] if conv["is_group"] else "",
-                    attachments=msg_data["attachments"],
-                    is_read=True  # Mark imported messages as read
-                )
-
-                messages_to_insert.append((conv["id"], msg))
-
-            # Bulk insert messages
-            if messages_to_insert:
-                inserted = self.message_store.bulk_insert_messages(messages_to_insert)
-                total_messages += inserted
-
-                # Ensure conversation exists
-                self.message_store.ensure_conversation(
-                    conv["id"],
-                    conv["name"],
-                    conv["is_group"]
-                )
-
-                # Update conversation metadata from imported messages
-                self.message_store.update_conversation_from_messages(conv["id"])
+        # Walk the whole messages table once, ordered by conversation, instead
+        # of issuing one query per conversation. SQLCipher then decrypts each
+        # page once and the per-query planning cost is paid a single time.
+        cursor = self._conn.cursor()
+        cursor.execute("""
+            SELECT
+                id,
+                conversationId,
+                source,
+                type,
+                body,
+                sent_at,
+                received_at,
+                hasAttachments,
+                CASE WHEN hasAttachments
+                     THEN json_extract(json, '$.attachments')
+                     ELSE NULL END
+            FROM messages
+            ORDER BY conversationId, sent_at ASC
+        """)
 
-            conv_count += 1
+        # One commit for the whole import: fsync dominates small-batch
+        # insert cost, so deferring it to the end cuts wall time sharply
+        with self.message_store.transaction():
+            for internal_id, rows in groupby(cursor, key=lambda r: r[1]):
+                conv = conv_by_internal_id.get(internal_id)
+                if conv is None:
+                    continue
+
+                if progress_callback:
+                    progress_callback(conv["name"], conv_count + 1, total_convs)
+
+                # Stream messages for this conversation, inserting in batches so
+                # memory stays bounded regardless of history size
+                conv_inserted = 0
+                batch = []
+                for row in rows:
+                    # Build the Message straight from the row tuple; going
+                    # through a dict here would add nine allocations and key
+                    # lookups per message on the import hot path
+                    is_outgoing = row[3] == "outgoing"
+
+                    # Pass the raw ms timestamp through; the store accepts it
+                    # directly, avoiding a datetime round-trip per message
+                    timestamp_ms = row[5] or row[6] or int(time.time() * 1000)
+
+                    msg = Message(
+                        sender=row[2] or (self.our_phone_number if is_outgoing else ""),
+                        sender_name="You" if is_outgoing else "",
+                        body=row[4] or "",
+                        timestamp=timestamp_ms,
+                        is_outgoing=is_outgoing,
+                        group_id=conv["id"] if conv["is_group"] else "",
+                        attachments=self._parse_attachments(row[8]),
+                        is_read=True  # Mark imported messages as read
+                    )
+
+                    batch.append((conv["id"], msg))
+                    if len(batch) >= self.IMPORT_BATCH_SIZE:
+                        conv_inserted += self.message_store.bulk_insert_messages(batch)
+                        batch.clear()
+
+                if batch:
+                    conv_inserted += self.message_store.bulk_insert_messages(batch)
+
+                if conv_inserted:
+                    total_messages += conv_inserted
+
+                    # Ensure conversation exists
+                    self.message_store.ensure_conversation(
+                        conv["id"],
+                        conv["name"],
+                        conv["is_group"]
+                    )
+
+                    # Update conversation metadata from imported messages
+                    self.message_store.update_conversation_from_messages(conv["id"])
+
+                conv_count += 1
 
         return conv_count, total_messages
 
@@ -6,29 +6,254 @@ Uses SQLCipher for encryption with the key stored in macOS Keychain.
 """
 
 import base64
+import binascii
+import ctypes
+import hashlib
 import json
 import os
+import queue
 import secrets
 import sqlite3
 import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass
 
 from signal_client import Message
 
+# Prefer orjson for stored attachment/group JSON on both read and write
+# paths; its bytes output is decoded so the columns stay TEXT either way
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Prefer MessagePack for attachment metadata: a C codec that is several
+# times faster than json and ~30% smaller on disk, which matters under
+# SQLCipher where every stored byte is encrypted. Values are
+# self-describing — BLOB means msgpack, TEXT means JSON — so databases
+# written with and without msgpack installed interoperate.
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+def _pack_attachments(attachments) -> "bytes | str":
+    """Serialize attachment metadata for storage."""
+    if HAS_MSGPACK:
+        return msgpack.packb(attachments, use_bin_type=True)
+    return _json_dumps(attachments)
+
+
+def _unpack_attachments(stored) -> list:
+    """Deserialize a stored attachments value of either format."""
+    if isinstance(stored, bytes):
+        if HAS_MSGPACK:
+            return msgpack.unpackb(stored, raw=False)
+        return []
+    return _json_loads(stored)
+
 
 # Keychain configuration for encryption key storage
 KEYCHAIN_SERVICE = "Signal TUI Safe Storage"
 KEYCHAIN_ACCOUNT = "Signal TUI Key"
 
 
+def _timestamp_ms(ts) -> int:
+    """Milliseconds since epoch for a datetime or raw-ms int timestamp."""
+    if isinstance(ts, int):
+        return ts
+    return int(ts.timestamp() * 1000)
+
+
+@lru_cache(maxsize=1024)
+def _conv_type(conversation_id: str) -> str:
+    """'private' or 'group' for a conversation ID, memoized per ID.
+
+    Private conversations are keyed by E.164 numbers, groups by base64
+    IDs. A session only ever touches a handful of IDs, so the cache makes
+    repeated classification on the per-message path a dict hit.
+    """
+    return "private" if conversation_id.startswith("+") else "group"
+
+
+def _dedup_hash(conversation_id: str, sent_at: int, source, body) -> bytes:
+    """8-byte BLAKE2b digest identifying a message for deduplication.
+
+    Hashing the identifying fields keeps the uniqueness index at ~16
+    bytes per row instead of carrying a second copy of every body.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"{conversation_id}|{sent_at}|{source or ''}|{body or ''}".encode("utf-8"))
+    return h.digest()
+
+
 class KeychainError(Exception):
     """Exception raised for Keychain access errors."""
     pass
 
 
+# Native Security.framework bindings. Talking to the Keychain in-process
+# avoids a fork+exec of the `security` CLI (tens of milliseconds per call).
+# On non-macOS platforms loading the framework raises OSError and callers
+# fall back to the subprocess path below.
+_SECURITY_FRAMEWORK_PATH = "/System/Library/Frameworks/Security.framework/Security"
+_CORE_FOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_kCFStringEncodingUTF8 = 0x08000100
+_errSecSuccess = 0
+
+_security_libs = None
+
+
+def _load_security_framework():
+    """Load and configure Security/CoreFoundation via ctypes (macOS only)."""
+    global _security_libs
+    if _security_libs is None:
+        security = ctypes.CDLL(_SECURITY_FRAMEWORK_PATH)
+        cf = ctypes.CDLL(_CORE_FOUNDATION_PATH)
+
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [
+            ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32
+        ]
+        cf.CFDictionaryCreate.restype = ctypes.c_void_p
+        cf.CFDictionaryCreate.argtypes = [
+            ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_long, ctypes.c_void_p, ctypes.c_void_p
+        ]
+        cf.CFDataCreate.restype = ctypes.c_void_p
+        cf.CFDataCreate.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long]
+        cf.CFDataGetLength.restype = ctypes.c_long
+        cf.CFDataGetLength.argtypes = [ctypes.c_void_p]
+        cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+        cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+        security.SecItemCopyMatching.restype = ctypes.c_int32
+        security.SecItemCopyMatching.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        security.SecItemAdd.restype = ctypes.c_int32
+        security.SecItemAdd.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        security.SecItemDelete.restype = ctypes.c_int32
+        security.SecItemDelete.argtypes = [ctypes.c_void_p]
+
+        _security_libs = (security, cf)
+    return _security_libs
+
+
+def _sec_const(lib, name: str) -> int:
+    """Read an exported CFTypeRef constant (e.g. kSecClass) from a library."""
+    return ctypes.c_void_p.in_dll(lib, name).value
+
+
+def _cf_dict(cf, pairs) -> int:
+    """Build a CFDictionary from (key, value) CFTypeRef pointer pairs."""
+    n = len(pairs)
+    keys = (ctypes.c_void_p * n)(*[k for k, _ in pairs])
+    values = (ctypes.c_void_p * n)(*[v for _, v in pairs])
+    key_cb = ctypes.addressof(ctypes.c_void_p.in_dll(cf, "kCFTypeDictionaryKeyCallBacks"))
+    val_cb = ctypes.addressof(ctypes.c_void_p.in_dll(cf, "kCFTypeDictionaryValueCallBacks"))
+    return cf.CFDictionaryCreate(None, keys, values, n, key_cb, val_cb)
+
+
+def _keychain_find_native() -> Optional[str]:
+    """Look up the stored key via SecItemCopyMatching, without a subprocess."""
+    security, cf = _load_security_framework()
+
+    service = cf.CFStringCreateWithCString(
+        None, KEYCHAIN_SERVICE.encode("utf-8"), _kCFStringEncodingUTF8)
+    account = cf.CFStringCreateWithCString(
+        None, KEYCHAIN_ACCOUNT.encode("utf-8"), _kCFStringEncodingUTF8)
+    query = _cf_dict(cf, [
+        (_sec_const(security, "kSecClass"),
+         _sec_const(security, "kSecClassGenericPassword")),
+        (_sec_const(security, "kSecAttrService"), service),
+        (_sec_const(security, "kSecAttrAccount"), account),
+        (_sec_const(security, "kSecReturnData"), _sec_const(cf, "kCFBooleanTrue")),
+    ])
+
+    data = ctypes.c_void_p()
+    try:
+        status = security.SecItemCopyMatching(query, ctypes.byref(data))
+        if status != _errSecSuccess or not data.value:
+            return None
+
+        raw = ctypes.string_at(cf.CFDataGetBytePtr(data), cf.CFDataGetLength(data))
+        cf.CFRelease(data)
+        return _decode_keychain_value(raw.decode("utf-8"))
+    finally:
+        cf.CFRelease(query)
+        cf.CFRelease(service)
+        cf.CFRelease(account)
+
+
+def _keychain_store_native(key_hex: str) -> bool:
+    """Store the key via SecItemAdd, replacing any existing item."""
+    security, cf = _load_security_framework()
+
+    service = cf.CFStringCreateWithCString(
+        None, KEYCHAIN_SERVICE.encode("utf-8"), _kCFStringEncodingUTF8)
+    account = cf.CFStringCreateWithCString(
+        None, KEYCHAIN_ACCOUNT.encode("utf-8"), _kCFStringEncodingUTF8)
+    identity = [
+        (_sec_const(security, "kSecClass"),
+         _sec_const(security, "kSecClassGenericPassword")),
+        (_sec_const(security, "kSecAttrService"), service),
+        (_sec_const(security, "kSecAttrAccount"), account),
+    ]
+
+    try:
+        # Delete any existing item first (not-found errors are fine)
+        delete_query = _cf_dict(cf, identity)
+        security.SecItemDelete(delete_query)
+        cf.CFRelease(delete_query)
+
+        value_bytes = key_hex.encode("utf-8")
+        value = cf.CFDataCreate(None, value_bytes, len(value_bytes))
+        add_query = _cf_dict(
+            cf, identity + [(_sec_const(security, "kSecValueData"), value)])
+        status = security.SecItemAdd(add_query, None)
+        cf.CFRelease(add_query)
+        cf.CFRelease(value)
+        return status == _errSecSuccess
+    finally:
+        cf.CFRelease(service)
+        cf.CFRelease(account)
+
+
+def _decode_keychain_value(value: str) -> Optional[str]:
+    """Normalize a Keychain payload to a hex key string.
+
+    New keys are stored as the hex string itself (it is ASCII-safe, so
+    wrapping it in base64 only added encode/decode passes on startup);
+    keys written by older versions are base64 of the raw bytes. Sniff the
+    format rather than re-encoding.
+    """
+    value = value.strip()
+    try:
+        bytes.fromhex(value)
+        return value.lower()
+    except ValueError:
+        pass
+
+    try:
+        return base64.b64decode(value).hex()
+    except (ValueError, binascii.Error):
+        return None
+
+
 def _get_key_from_keychain() -> Optional[str]:
     """
     Retrieve the database encryption key from macOS Keychain.
@@ -36,6 +261,13 @@ def _get_key_from_keychain() -> Optional[str]:
     Returns:
         The hex-encoded encryption key, or None if not found.
     """
+    try:
+        return _keychain_find_native()
+    except (OSError, AttributeError, ValueError):
+        # Framework unavailable (non-macOS) or unexpected payload —
+        # fall back to the security(1) CLI
+        pass
+
     try:
         result = subprocess.run(
             [
@@ -52,10 +284,7 @@ def _get_key_from_keychain() -> Optional[str]:
         if result.returncode != 0:
             return None
 
-        # Key is stored as base64
-        key_b64 = result.stdout.strip()
-        key_bytes = base64.b64decode(key_b64)
-        return key_bytes.hex()
+        return _decode_keychain_value(result.stdout)
 
     except (subprocess.TimeoutExpired, Exception):
         return None
@@ -72,10 +301,12 @@ def _store_key_in_keychain(key_hex: str) -> bool:
         True if successful, False otherwise.
     """
     try:
-        # Convert hex to base64 for storage
-        key_bytes = bytes.fromhex(key_hex)
-        key_b64 = base64.b64encode(key_bytes).decode('utf-8')
+        return _keychain_store_native(key_hex)
+    except (OSError, AttributeError):
+        # Framework unavailable (non-macOS) — fall back to the security(1) CLI
+        pass
 
+    try:
         # Delete existing key if present (ignore errors)
         subprocess.run(
             [
@@ -93,7 +324,7 @@ def _store_key_in_keychain(key_hex: str) -> bool:
                 "security", "add-generic-password",
                 "-s", KEYCHAIN_SERVICE,
                 "-a", KEYCHAIN_ACCOUNT,
-                "-w", key_b64,
+                "-w", key_hex,
                 "-U"  # Update if exists
             ],
             capture_output=True,
@@ -145,6 +376,19 @@ def get_or_create_encryption_key() -> str:
     return key
 
 
+# Key cached across MessageStore instances so the `security` shell-out
+# (a fork+exec of tens of milliseconds) happens at most once per process
+_encryption_key_cache: Optional[str] = None
+
+
+def _cached_encryption_key() -> str:
+    """Return the encryption key, fetching it from Keychain only once."""
+    global _encryption_key_cache
+    if _encryption_key_cache is None:
+        _encryption_key_cache = get_or_create_encryption_key()
+    return _encryption_key_cache
+
+
 @dataclass
 class StoredConversation:
     """Represents a stored conversation."""
@@ -156,10 +400,151 @@ class StoredConversation:
     unread_count: int
 
 
+class CachedGroup:
+    """Dict-like view over a cached group row.
+
+    id and name are served straight from their columns; the stored group
+    payload is only deserialized on first access to any other key, so the
+    common caller (the contact list, which renders id and name) never pays
+    for parsing every group blob.
+    """
+
+    __slots__ = ("id", "name", "_blob", "_data")
+
+    def __init__(self, group_id: str, name: str, blob):
+        self.id = group_id
+        self.name = name
+        self._blob = blob
+        self._data = None
+
+    @property
+    def data(self) -> dict:
+        """The full group dict, parsed lazily from storage."""
+        if self._data is None:
+            try:
+                self._data = _json_loads(self._blob) if self._blob else {}
+            except ValueError:
+                self._data = {}
+            self._data.setdefault("id", self.id)
+            self._data.setdefault("name", self.name)
+        return self._data
+
+    def get(self, key, default=None):
+        if key == "id":
+            return self.id if self.id is not None else default
+        if key == "name":
+            return self.name if self.name is not None else default
+        return self.data.get(key, default)
+
+    def __getitem__(self, key):
+        if key == "id":
+            return self.id
+        if key == "name":
+            return self.name
+        return self.data[key]
+
+    def __contains__(self, key) -> bool:
+        return key in ("id", "name") or key in self.data
+
+
 class MessageStore:
     """SQLCipher-encrypted message persistence layer."""
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 2
+
+    # Thread id of the thread inside an explicit transaction() block, or
+    # None. The flag is per-thread on purpose: only the owning thread
+    # defers commits and bypasses the writer queue, so a message arriving
+    # on another thread during a long-lived block (e.g. a desktop import)
+    # is enqueued instead of blocking that thread on the write lock.
+    _txn_owner = None
+
+    # Serializes multi-statement work on the shared connection: the
+    # writer's batches, transaction() blocks, and synchronous writes.
+    # Reentrant so write methods called inside a transaction() block can
+    # re-acquire on the same thread.
+    _write_lock = threading.RLock()
+
+    # Bounded queue feeding the background writer thread; the class-level
+    # None default means writes run synchronously (tests, or before
+    # __init__ finishes)
+    _write_q = None
+
+    # How many queued statements the writer folds into one commit envelope
+    _WRITER_BATCH_MAX = 256
+
+    # Hot-path SQL hoisted to class constants. A stable string identity per
+    # statement keeps the connection's prepared-statement cache warm, and
+    # conn.execute() on these skips the per-call cursor allocation.
+    _SQL_INSERT_MESSAGE = """
+        INSERT OR IGNORE INTO messages
+        (conversationId, source, body, sent_at, received_at, type, hasAttachments, attachments_json, isRead)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _SQL_INSERT_MESSAGE_HASHED = """
+        INSERT OR IGNORE INTO messages
+        (conversationId, source, body, sent_at, received_at, type, hasAttachments, attachments_json, isRead, dedup_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # True once _init_db has ensured the dedup_hash column and its unique
+    # index exist; databases bootstrapped externally (tests) stay on the
+    # legacy 4-column UNIQUE constraint
+    _has_dedup_hash = False
+
+    # DB-API module the connection came from. pysqlcipher3's exception
+    # classes don't subclass the stdlib sqlite3 ones, so fallback guards
+    # must catch self._db.Error rather than sqlite3.Error; the stdlib
+    # default covers externally injected connections (tests).
+    _db = sqlite3
+
+    # Must execute immediately after the message INSERT on the same
+    # connection: changes() is 1 if that insert stored a row and 0 if
+    # INSERT OR IGNORE hit a duplicate, so a redelivered message doesn't
+    # inflate the denormalized unread counter
+    _SQL_UPSERT_CONVERSATION = """
+        INSERT INTO conversations (id, name, type, lastMessage, lastMessageAt, unreadCount)
+        VALUES (?, ?, ?, ?, ?, ? * changes())
+        ON CONFLICT(id) DO UPDATE SET
+            lastMessage = excluded.lastMessage,
+            lastMessageAt = excluded.lastMessageAt,
+            unreadCount = conversations.unreadCount + ? * changes()
+        WHERE conversations.lastMessageAt IS NULL
+           OR excluded.lastMessageAt >= conversations.lastMessageAt
+    """
+
+    # Column lists match idx_messages_conv_cover so the queries are
+    # answered from the index without touching the table
+    _SQL_GET_MESSAGES = """
+        SELECT source, body, sent_at, type, attachments_json, isRead
+        FROM messages
+        WHERE conversationId = ?
+        ORDER BY sent_at DESC
+        LIMIT ?
+    """
+
+    _SQL_GET_MESSAGES_BEFORE = """
+        SELECT source, body, sent_at, type, attachments_json, isRead
+        FROM messages
+        WHERE conversationId = ? AND sent_at < ?
+        ORDER BY sent_at DESC
+        LIMIT ?
+    """
+
+    _SQL_MARK_MESSAGES_READ = """
+        UPDATE messages SET isRead = 1
+        WHERE conversationId = ? AND isRead = 0
+    """
+
+    _SQL_ZERO_UNREAD = """
+        UPDATE conversations SET unreadCount = 0
+        WHERE id = ?
+    """
+
+    _SQL_UNREAD_LOOKUP = """
+        SELECT unreadCount FROM conversations WHERE id = ?
+    """
 
     def __init__(self, db_path: Path):
         """
@@ -172,8 +557,18 @@ class MessageStore:
         self._ensure_db_dir()
         self._conn = None
         self._encryption_key: Optional[str] = None
+        # Opens the connection eagerly: key derivation and schema checks run
+        # at startup rather than mid-render on the first query
         self._init_db()
 
+        # Background writer: save_message enqueues its statements and
+        # returns immediately, so SQLCipher page encryption and fsync
+        # happen off the receive loop. Writes arriving close together are
+        # coalesced into a single commit.
+        self._write_q = queue.Queue(maxsize=1024)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
     def _ensure_db_dir(self) -> None:
         """Create database directory if it doesn't exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -189,39 +584,97 @@ class MessageStore:
                     "pysqlcipher3 is required for encrypted message storage. "
                     "Install it with: brew install sqlcipher && pip install pysqlcipher3"
                 )
+            self._db = sqlcipher
 
             # Get or create encryption key
             if self._encryption_key is None:
-                self._encryption_key = get_or_create_encryption_key()
+                self._encryption_key = _cached_encryption_key()
 
-            # Connect to database
-            self._conn = sqlcipher.connect(str(self.db_path), check_same_thread=False)
-
-            # Set encryption key
-            cursor = self._conn.cursor()
-            cursor.execute(f"PRAGMA key = \"x'{self._encryption_key}'\"")
-
-            # Verify the key works (will fail if wrong key or unencrypted db)
+            # Connect with the fast cipher settings first. Databases created
+            # before those settings existed use SQLCipher defaults, so fall
+            # back to a plain open if verification fails.
             try:
-                cursor.execute("SELECT count(*) FROM sqlite_master")
-            except Exception as e:
-                self._conn.close()
-                self._conn = None
-                raise RuntimeError(
-                    f"Failed to open encrypted database. "
-                    f"If you have an old unencrypted database, delete it: {self.db_path}"
-                ) from e
+                cursor = self._open_conn(sqlcipher, fast_cipher=True)
+            except Exception:
+                try:
+                    cursor = self._open_conn(sqlcipher, fast_cipher=False)
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Failed to open encrypted database. "
+                        f"If you have an old unencrypted database, delete it: {self.db_path}"
+                    ) from e
+
+            # Performance PRAGMAs for the long-lived connection. WAL +
+            # synchronous=NORMAL remove the per-commit fsync from the hot
+            # save path, cipher_memory_security=OFF drops SQLCipher's memory
+            # wiping overhead, and the cache/mmap settings keep decrypted
+            # pages resident across queries.
+            cursor.execute("PRAGMA cipher_memory_security = OFF")
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("PRAGMA synchronous = NORMAL")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+            cursor.execute("PRAGMA cache_size = -20000")
+            cursor.execute("PRAGMA mmap_size = 268435456")
+            cursor.execute("PRAGMA wal_autocheckpoint = 1000")
+
+            # The TUI is the only process that opens this database, so hold
+            # the file lock for the life of the connection instead of
+            # re-acquiring it around every transaction (several syscalls per
+            # commit). With WAL this also skips -shm coordination. Side
+            # effect: other processes (e.g. the sqlcipher CLI) can't attach
+            # while the TUI is running.
+            cursor.execute("PRAGMA locking_mode = EXCLUSIVE")
+            cursor.execute("BEGIN IMMEDIATE")
+            self._conn.commit()
 
             # Set row factory for dict-like access
             self._conn.row_factory = sqlcipher.Row
 
         return self._conn
 
+    def _open_conn(self, sqlcipher, fast_cipher: bool):
+        """
+        Open and key the database, returning a verified cursor.
+
+        With fast_cipher, the cipher is configured for the raw-key fast
+        path: we always supply a full 256-bit CSPRNG key (secrets.token_hex),
+        never a passphrase, so PBKDF2 stretching adds no security and
+        SHA256 page HMACs are preferred over SHA512 for hardware
+        acceleration. These settings must match the values the database was
+        created with, hence the caller's fallback to defaults.
+        """
+        self._conn = sqlcipher.connect(str(self.db_path), check_same_thread=False)
+
+        # Set encryption key
+        cursor = self._conn.cursor()
+        cursor.execute(f"PRAGMA key = \"x'{self._encryption_key}'\"")
+
+        if fast_cipher:
+            cursor.execute("PRAGMA cipher_page_size = 4096")
+            cursor.execute("PRAGMA kdf_iter = 1")
+            cursor.execute("PRAGMA cipher_hmac_algorithm = HMAC_SHA256")
+
+        # Verify the key works (will fail if wrong key, wrong cipher
+        # settings, or an unencrypted db)
+        try:
+            cursor.execute("SELECT count(*) FROM sqlite_master")
+        except Exception:
+            self._conn.close()
+            self._conn = None
+            raise
+
+        return cursor
+
     def _init_db(self) -> None:
         """Initialize database schema."""
         conn = self._get_conn()
         cursor = conn.cursor()
 
+        # Incremental autovacuum keeps the file from growing without bound
+        # as messages are purged. Only takes effect when the database is
+        # first created (a no-op on existing files).
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # Create messages table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS messages (
@@ -235,10 +688,38 @@ class MessageStore:
                 hasAttachments INTEGER DEFAULT 0,
                 attachments_json TEXT,
                 isRead INTEGER DEFAULT 0,
-                UNIQUE(conversationId, sent_at, source, body)
+                dedup_hash BLOB
             )
         """)
 
+        # Deduplicate via an 8-byte hash instead of the former 4-column
+        # UNIQUE(conversationId, sent_at, source, body) constraint, whose
+        # index duplicated every message body. Databases from before the
+        # hash column keep their table-level constraint (dropping it would
+        # need a full table rebuild) but gain the cheap index for new rows.
+        try:
+            cursor.execute("PRAGMA table_info(messages)")
+            columns = [col[1] for col in cursor.fetchall()]
+            if "dedup_hash" not in columns:
+                cursor.execute("ALTER TABLE messages ADD COLUMN dedup_hash BLOB")
+                cursor.execute(
+                    "SELECT id, conversationId, sent_at, source, body FROM messages"
+                )
+                cursor.executemany(
+                    "UPDATE messages SET dedup_hash = ? WHERE id = ?",
+                    [
+                        (_dedup_hash(conv, sent, src, body), row_id)
+                        for (row_id, conv, sent, src, body) in cursor.fetchall()
+                    ]
+                )
+            cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_dedup
+                ON messages(dedup_hash)
+            """)
+            self._has_dedup_hash = True
+        except self._db.Error:
+            self._has_dedup_hash = False
+
         # Create conversations table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS conversations (
@@ -279,10 +760,14 @@ class MessageStore:
             )
         """)
 
-        # Create indexes for faster queries
+        # Covering index for the history fetch: get_messages selects only
+        # these columns, so SQLite answers from the index alone instead of
+        # decrypting an extra heap page per row. Supersedes the old
+        # two-column idx_messages_conv.
+        cursor.execute("DROP INDEX IF EXISTS idx_messages_conv")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_messages_conv
-            ON messages(conversationId, sent_at DESC)
+            CREATE INDEX IF NOT EXISTS idx_messages_conv_cover
+            ON messages(conversationId, sent_at DESC, source, body, type, attachments_json, isRead)
         """)
 
         cursor.execute("""
@@ -290,6 +775,61 @@ class MessageStore:
             ON messages(source)
         """)
 
+        # Partial index covering the unread-count fallback scan; it only
+        # holds unread incoming rows, so it stays tiny
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_messages_unread
+            ON messages(conversationId) WHERE isRead = 0 AND type = 'incoming'
+        """)
+
+        # Full-text index over message bodies, kept in sync by triggers so
+        # search doesn't have to LIKE-scan the whole table. FTS5 can be
+        # missing from some SQLCipher builds; search_messages falls back
+        # to the LIKE scan when the table isn't there.
+        try:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'"
+            )
+            fts_existed = cursor.fetchone() is not None
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    body,
+                    content='messages',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_ai
+                AFTER INSERT ON messages BEGIN
+                    INSERT INTO messages_fts(rowid, body) VALUES (new.id, new.body);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_ad
+                AFTER DELETE ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_au
+                AFTER UPDATE OF body ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                    INSERT INTO messages_fts(rowid, body) VALUES (new.id, new.body);
+                END
+            """)
+
+            if not fts_existed:
+                # Index messages that predate the FTS table
+                cursor.execute(
+                    "INSERT INTO messages_fts(rowid, body) SELECT id, body FROM messages"
+                )
+        except self._db.OperationalError:
+            pass
+
         # Create schema version table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS schema_version (
@@ -302,12 +842,111 @@ class MessageStore:
         row = cursor.fetchone()
         if row is None:
             cursor.execute("INSERT INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
+            # Seed planner statistics for the fresh indexes; PRAGMA optimize
+            # in close() keeps them current as the tables grow
+            cursor.execute("ANALYZE")
+        elif row[0] < self.SCHEMA_VERSION:
+            cursor.execute("UPDATE schema_version SET version = ?", (self.SCHEMA_VERSION,))
 
         conn.commit()
 
+    @property
+    def _in_transaction(self) -> bool:
+        """Whether the calling thread is inside a transaction() block."""
+        return self._txn_owner == threading.get_ident()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Batch many writes into a single commit.
+
+        Inside the block, the calling thread's write methods defer their
+        commits; everything is committed once on exit (or rolled back on
+        error). Nested use is a no-op, deferring to the outermost block.
+        Other threads are unaffected: their writes queue up behind the
+        write lock as usual.
+        """
+        conn = self._get_conn()
+        if self._in_transaction:
+            yield
+            return
+
+        with self._write_lock:
+            self._txn_owner = threading.get_ident()
+            try:
+                yield
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._txn_owner = None
+
+    def _commit(self, conn) -> None:
+        """Commit now, unless an enclosing transaction() will do it."""
+        if not self._in_transaction:
+            conn.commit()
+
+    def _writer_loop(self) -> None:
+        """Drain queued writes, batching them per commit.
+
+        Each queue item is a tuple of (sql, params) statements executed
+        back-to-back, so dependent pairs (message insert + conversation
+        upsert reading changes()) can never interleave with another
+        item's statements. Blocks on the queue, then keeps collecting
+        items that arrive within a short window so a burst of incoming
+        messages costs one fsync instead of one per message.
+        """
+        conn = self._get_conn()
+        q = self._write_q
+        while True:
+            batch = [q.get()]
+            while len(batch) < self._WRITER_BATCH_MAX:
+                try:
+                    batch.append(q.get(timeout=0.01))
+                except queue.Empty:
+                    break
+
+            # The lock — not a polled flag — keeps the batch from
+            # interleaving with a transaction() block or synchronous write
+            # on another thread, where a rollback here could discard the
+            # other thread's in-flight statements
+            with self._write_lock:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for stmts in batch:
+                        for sql, params in stmts:
+                            conn.execute(sql, params)
+                    conn.commit()
+                except Exception as e:
+                    # A poisoned statement must never kill this thread:
+                    # flush() joins the queue from every read path, and a
+                    # dead writer would leave it (and the UI) blocked
+                    # forever on the next enqueue
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    print(f"Background write failed: {e}", file=sys.stderr)
+                finally:
+                    for _ in batch:
+                        q.task_done()
+
+    def flush(self) -> None:
+        """Block until all queued background writes have hit the database."""
+        if self._write_q is not None:
+            self._write_q.join()
+
     def close(self) -> None:
         """Close database connection."""
+        self.flush()
         if self._conn:
+            try:
+                # Let SQLite refresh stale index statistics if the query
+                # planner would benefit (cheap, usually a no-op)
+                self._conn.execute("PRAGMA optimize")
+            except self._db.Error:
+                pass
             self._conn.close()
             self._conn = None
 
@@ -326,39 +965,61 @@ class MessageStore:
         Returns:
             The row ID of the inserted message
         """
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        sent_at = int(message.timestamp.timestamp() * 1000)
-        received_at = int(datetime.now().timestamp() * 1000)
+        sent_at = _timestamp_ms(message.timestamp)
+        # Cheaper than datetime.now().timestamp(): no object allocation or
+        # timezone lookup on the receive hot path
+        received_at = time.time_ns() // 1_000_000
         msg_type = "outgoing" if message.is_outgoing else "incoming"
 
-        attachments_json = json.dumps(message.attachments) if message.attachments else None
+        attachments_json = _pack_attachments(message.attachments) if message.attachments else None
+
+        insert_params = (
+            conversation_id,
+            message.sender,
+            message.body,
+            sent_at,
+            received_at,
+            msg_type,
+            1 if message.attachments else 0,
+            attachments_json,
+            1 if message.is_read or message.is_outgoing else 0
+        )
+        if self._has_dedup_hash:
+            insert_sql = self._SQL_INSERT_MESSAGE_HASHED
+            insert_params += (_dedup_hash(conversation_id, sent_at, message.sender, message.body),)
+        else:
+            insert_sql = self._SQL_INSERT_MESSAGE
 
-        try:
-            cursor.execute("""
-                INSERT OR IGNORE INTO messages
-                (conversationId, source, body, sent_at, received_at, type, hasAttachments, attachments_json, isRead)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                conversation_id,
-                message.sender,
-                message.body,
-                sent_at,
-                received_at,
-                msg_type,
-                1 if message.attachments else 0,
-                attachments_json,
-                1 if message.is_read or message.is_outgoing else 0
-            ))
-            conn.commit()
+        # Hand both statements to the background writer: the UI renders
+        # from the in-memory Message, so the caller doesn't need to wait
+        # for SQLCipher page encryption and fsync. Read paths flush first,
+        # preserving read-your-writes.
+        if self._write_q is not None and not self._in_transaction:
+            try:
+                # One queue item for the pair: the upsert's changes() gate
+                # only works when it runs directly after its insert
+                self._write_q.put_nowait((
+                    (insert_sql, insert_params),
+                    (
+                        self._SQL_UPSERT_CONVERSATION,
+                        self._conversation_upsert_params(conversation_id, message)
+                    ),
+                ))
+                return 0
+            except queue.Full:
+                pass  # writer is behind; fall through to a synchronous write
 
-            # Update conversation
-            self._update_conversation_on_message(conversation_id, message)
+        conn = self._get_conn()
+        with self._write_lock:
+            try:
+                cursor = conn.execute(insert_sql, insert_params)
+                # Update conversation metadata, then commit both writes together
+                self._update_conversation_on_message(conversation_id, message)
+                self._commit(conn)
 
-            return cursor.lastrowid
-        except sqlite3.Error:
-            return -1
+                return cursor.lastrowid
+            except self._db.Error:
+                return -1
 
     def get_messages(
         self,
@@ -377,38 +1038,41 @@ class MessageStore:
         Returns:
             List of Message objects, oldest first
         """
+        self.flush()
         conn = self._get_conn()
-        cursor = conn.cursor()
 
         if before_timestamp:
-            cursor.execute("""
-                SELECT * FROM messages
-                WHERE conversationId = ? AND sent_at < ?
-                ORDER BY sent_at DESC
-                LIMIT ?
-            """, (conversation_id, before_timestamp, limit))
+            cursor = conn.execute(
+                self._SQL_GET_MESSAGES_BEFORE,
+                (conversation_id, before_timestamp, limit)
+            )
         else:
-            cursor.execute("""
-                SELECT * FROM messages
-                WHERE conversationId = ?
-                ORDER BY sent_at DESC
-                LIMIT ?
-            """, (conversation_id, limit))
+            cursor = conn.execute(self._SQL_GET_MESSAGES, (conversation_id, limit))
 
+        # Raw tuples: positional unpacking avoids ~9 by-name column lookups
+        # per row on the most common UI fetch
+        cursor.row_factory = None
         rows = cursor.fetchall()
 
+        # Localize hot names for the materialization loop
+        make_message = Message
+        loads = _unpack_attachments
+        group_id = conversation_id if _conv_type(conversation_id) == "group" else ""
+        now_ms = time.time_ns() // 1_000_000
+
         messages = []
-        for row in reversed(rows):  # Reverse to get chronological order
-            attachments = json.loads(row["attachments_json"]) if row["attachments_json"] else []
-            msg = Message(
-                sender=row["source"] or "",
+        for (source, body, sent_at, msg_type, attachments_json, is_read) in reversed(rows):
+            msg = make_message(
+                sender=source or "",
                 sender_name="",  # Will be populated by caller
-                body=row["body"] or "",
-                timestamp=datetime.fromtimestamp(row["sent_at"] / 1000) if row["sent_at"] else datetime.now(),
-                is_outgoing=(row["type"] == "outgoing"),
-                group_id=conversation_id if not conversation_id.startswith("+") else "",
-                attachments=attachments,
-                is_read=bool(row["isRead"])
+                body=body or "",
+                # Raw epoch ms: Message.timestamp_dt converts lazily, so a
+                # bulk load doesn't build a datetime per row
+                timestamp=sent_at or now_ms,
+                is_outgoing=(msg_type == "outgoing"),
+                group_id=group_id,
+                attachments=loads(attachments_json) if attachments_json else [],
+                is_read=bool(is_read)
             )
             messages.append(msg)
 
@@ -416,25 +1080,37 @@ class MessageStore:
 
     def mark_messages_read(self, conversation_id: str) -> None:
         """Mark all messages in a conversation as read."""
+        self.flush()
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE messages SET isRead = 1
-            WHERE conversationId = ? AND isRead = 0
-        """, (conversation_id,))
-        conn.commit()
-
-        # Update unread count in conversation
-        cursor.execute("""
-            UPDATE conversations SET unreadCount = 0
-            WHERE id = ?
-        """, (conversation_id,))
-        conn.commit()
+        with self._write_lock:
+            # Both updates land in one commit: a single fsync, and no window
+            # where unreadCount disagrees with the messages table
+            conn.execute(self._SQL_MARK_MESSAGES_READ, (conversation_id,))
+            conn.execute(self._SQL_ZERO_UNREAD, (conversation_id,))
+            self._commit(conn)
+
+            # Opportunistically hand a few freed pages back to the
+            # filesystem; this path runs on conversation open, never on
+            # the receive loop
+            try:
+                conn.execute("PRAGMA incremental_vacuum(1000)")
+            except self._db.Error:
+                pass
 
     def get_unread_count(self, conversation_id: str) -> int:
         """Get the number of unread messages in a conversation."""
+        self.flush()
         conn = self._get_conn()
-        cursor = conn.cursor()
+
+        # The denormalized counter on conversations is maintained by
+        # _update_conversation_on_message and mark_messages_read, so this
+        # is a primary-key lookup instead of a scan over the messages table
+        cursor = conn.execute(self._SQL_UNREAD_LOOKUP, (conversation_id,))
+        row = cursor.fetchone()
+        if row is not None and row[0] is not None:
+            return row[0]
+
+        # No conversation row yet — count the messages directly
         cursor.execute("""
             SELECT COUNT(*) FROM messages
             WHERE conversationId = ? AND isRead = 0 AND type = 'incoming'
@@ -452,31 +1128,63 @@ class MessageStore:
         Returns:
             List of (conversation_id, Message) tuples
         """
+        self.flush()
         conn = self._get_conn()
         cursor = conn.cursor()
+        # Raw tuples, as in get_messages: positional access is cheaper than
+        # by-name lookups when materializing many rows
+        cursor.row_factory = None
+
+        # Prefer the FTS5 index (kept current by triggers). Quoting the
+        # query makes user input a plain phrase instead of MATCH syntax.
+        rows = None
+        if query:
+            try:
+                phrase = '"{}"'.format(query.replace('"', '""'))
+                cursor.execute("""
+                    SELECT m.conversationId, m.source, m.body, m.sent_at,
+                           m.type, m.attachments_json, m.isRead
+                    FROM messages_fts f
+                    JOIN messages m ON m.id = f.rowid
+                    WHERE messages_fts MATCH ?
+                    ORDER BY f.rank
+                    LIMIT ?
+                """, (phrase, limit))
+                rows = cursor.fetchall()
+            except self._db.OperationalError:
+                # FTS table missing (pre-FTS database or no FTS5 support)
+                rows = None
+
+        if rows is None:
+            # Fall back to a LIKE scan
+            search_pattern = f"%{query}%"
+            cursor.execute("""
+                SELECT conversationId, source, body, sent_at,
+                       type, attachments_json, isRead
+                FROM messages
+                WHERE body LIKE ?
+                ORDER BY sent_at DESC
+                LIMIT ?
+            """, (search_pattern, limit))
+            rows = cursor.fetchall()
 
-        # Use LIKE for simple text search
-        search_pattern = f"%{query}%"
-        cursor.execute("""
-            SELECT * FROM messages
-            WHERE body LIKE ?
-            ORDER BY sent_at DESC
-            LIMIT ?
-        """, (search_pattern, limit))
+        make_message = Message
+        loads = _unpack_attachments
+        now_ms = time.time_ns() // 1_000_000
 
         results = []
-        for row in cursor.fetchall():
-            attachments = json.loads(row["attachments_json"]) if row["attachments_json"] else []
-            msg = Message(
-                sender=row["source"] or "",
+        for (conv_id, source, body, sent_at, msg_type,
+             attachments_json, is_read) in rows:
+            msg = make_message(
+                sender=source or "",
                 sender_name="",
-                body=row["body"] or "",
-                timestamp=datetime.fromtimestamp(row["sent_at"] / 1000) if row["sent_at"] else datetime.now(),
-                is_outgoing=(row["type"] == "outgoing"),
-                attachments=attachments,
-                is_read=bool(row["isRead"])
+                body=body or "",
+                timestamp=sent_at or now_ms,
+                is_outgoing=(msg_type == "outgoing"),
+                attachments=loads(attachments_json) if attachments_json else [],
+                is_read=bool(is_read)
             )
-            results.append((row["conversationId"], msg))
+            results.append((conv_id, msg))
 
         return results
 
@@ -485,46 +1193,39 @@ class MessageStore:
     # ========================================================================
 
     def _update_conversation_on_message(self, conversation_id: str, message: Message) -> None:
-        """Update conversation metadata when a message is added."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
-
-        sent_at = int(message.timestamp.timestamp() * 1000)
-        is_group = not conversation_id.startswith("+")
-        conv_type = "group" if is_group else "private"
-
-        # Get existing conversation
-        cursor.execute("SELECT * FROM conversations WHERE id = ?", (conversation_id,))
-        existing = cursor.fetchone()
-
-        if existing:
-            # Update if this message is newer
-            if existing["lastMessageAt"] is None or sent_at >= existing["lastMessageAt"]:
-                new_unread = existing["unreadCount"]
-                if not message.is_outgoing and not message.is_read:
-                    new_unread += 1
+        """Update conversation metadata when a message is added.
 
-                cursor.execute("""
-                    UPDATE conversations
-                    SET lastMessage = ?, lastMessageAt = ?, unreadCount = ?
-                    WHERE id = ?
-                """, (message.body[:100] if message.body else "[Attachment]", sent_at, new_unread, conversation_id))
-        else:
-            # Create new conversation
-            unread = 0 if message.is_outgoing else 1
-            cursor.execute("""
-                INSERT INTO conversations (id, name, type, lastMessage, lastMessageAt, unreadCount)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                conversation_id,
-                message.sender_name or conversation_id,
-                conv_type,
-                message.body[:100] if message.body else "[Attachment]",
-                sent_at,
-                unread
-            ))
+        Issues a single UPSERT instead of a SELECT plus UPDATE/INSERT pair,
+        so the hot receive path makes one statement and no extra commit
+        (the caller commits). Must run directly after the message INSERT:
+        the upsert reads changes() to skip the unread increment when the
+        insert was a dedup no-op.
+        """
+        conn = self._get_conn()
+        conn.execute(
+            self._SQL_UPSERT_CONVERSATION,
+            self._conversation_upsert_params(conversation_id, message)
+        )
 
-        conn.commit()
+    @staticmethod
+    def _conversation_upsert_params(conversation_id: str, message: Message) -> tuple:
+        """Parameter tuple for _SQL_UPSERT_CONVERSATION."""
+        sent_at = _timestamp_ms(message.timestamp)
+        conv_type = _conv_type(conversation_id)
+
+        snippet = message.body[:100] if message.body else "[Attachment]"
+        init_unread = 0 if message.is_outgoing else 1
+        inc_unread = 1 if (not message.is_outgoing and not message.is_read) else 0
+
+        return (
+            conversation_id,
+            message.sender_name or conversation_id,
+            conv_type,
+            snippet,
+            sent_at,
+            init_unread,
+            inc_unread
+        )
 
     def get_conversation(self, conversation_id: str) -> Optional[StoredConversation]:
         """Get a conversation by ID."""
@@ -544,37 +1245,45 @@ class MessageStore:
             )
         return None
 
-    def get_all_conversations(self) -> list[StoredConversation]:
-        """Get all conversations, sorted by last message time."""
+    def iter_conversations(self) -> Iterator[StoredConversation]:
+        """Stream conversations sorted by last message time.
+
+        Iterating the cursor materializes one row at a time, so rendering
+        a long conversation list doesn't first build a second copy of it.
+        """
+        self.flush()
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM conversations
+        cursor = conn.execute("""
+            SELECT id, name, type, lastMessage, lastMessageAt, unreadCount
+            FROM conversations
             ORDER BY lastMessageAt DESC NULLS LAST
         """)
+        cursor.row_factory = None
+
+        for (conv_id, name, conv_type, last_msg, last_at, unread) in cursor:
+            yield StoredConversation(
+                id=conv_id,
+                name=name or conv_id,
+                type=conv_type or "private",
+                last_message=last_msg or "",
+                last_message_at=last_at,
+                unread_count=unread or 0
+            )
 
-        conversations = []
-        for row in cursor.fetchall():
-            conversations.append(StoredConversation(
-                id=row["id"],
-                name=row["name"] or row["id"],
-                type=row["type"] or "private",
-                last_message=row["lastMessage"] or "",
-                last_message_at=row["lastMessageAt"],
-                unread_count=row["unreadCount"] or 0
-            ))
-
-        return conversations
+    def get_all_conversations(self) -> list[StoredConversation]:
+        """Get all conversations, sorted by last message time."""
+        return list(self.iter_conversations())
 
     def update_conversation_name(self, conversation_id: str, name: str) -> None:
         """Update the display name for a conversation."""
         conn = self._get_conn()
         cursor = conn.cursor()
-        cursor.execute("""
-            UPDATE conversations SET name = ?
-            WHERE id = ?
-        """, (name, conversation_id))
-        conn.commit()
+        with self._write_lock:
+            cursor.execute("""
+                UPDATE conversations SET name = ?
+                WHERE id = ?
+            """, (name, conversation_id))
+            self._commit(conn)
 
     def ensure_conversation(self, conversation_id: str, name: str, is_group: bool) -> None:
         """Ensure a conversation exists in the database."""
@@ -584,11 +1293,12 @@ class MessageStore:
         cursor.execute("SELECT id FROM conversations WHERE id = ?", (conversation_id,))
         if cursor.fetchone() is None:
             conv_type = "group" if is_group else "private"
-            cursor.execute("""
-                INSERT INTO conversations (id, name, type, lastMessage, lastMessageAt, unreadCount)
-                VALUES (?, ?, ?, '', NULL, 0)
-            """, (conversation_id, name, conv_type))
-            conn.commit()
+            with self._write_lock:
+                cursor.execute("""
+                    INSERT INTO conversations (id, name, type, lastMessage, lastMessageAt, unreadCount)
+                    VALUES (?, ?, ?, '', NULL, 0)
+                """, (conversation_id, name, conv_type))
+                self._commit(conn)
 
     def update_conversation_from_messages(self, conversation_id: str) -> None:
         """Update conversation metadata from stored messages."""
@@ -608,12 +1318,13 @@ class MessageStore:
             last_message = row["body"][:100] if row["body"] else "[Attachment]"
             last_message_at = row["sent_at"]
 
-            cursor.execute("""
-                UPDATE conversations
-                SET lastMessage = ?, lastMessageAt = ?
-                WHERE id = ? AND (lastMessageAt IS NULL OR lastMessageAt < ?)
-            """, (last_message, last_message_at, conversation_id, last_message_at))
-            conn.commit()
+            with self._write_lock:
+                cursor.execute("""
+                    UPDATE conversations
+                    SET lastMessage = ?, lastMessageAt = ?
+                    WHERE id = ? AND (lastMessageAt IS NULL OR lastMessageAt < ?)
+                """, (last_message, last_message_at, conversation_id, last_message_at))
+                self._commit(conn)
 
     # ========================================================================
     # Bulk Operations (for import)
@@ -632,36 +1343,49 @@ class MessageStore:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        inserted = 0
-        for conversation_id, message in messages:
-            sent_at = int(message.timestamp.timestamp() * 1000)
-            received_at = sent_at  # Use sent_at for imported messages
-            msg_type = "outgoing" if message.is_outgoing else "incoming"
-            attachments_json = json.dumps(message.attachments) if message.attachments else None
+        with_hash = self._has_dedup_hash
+        insert_sql = self._SQL_INSERT_MESSAGE_HASHED if with_hash else self._SQL_INSERT_MESSAGE
 
-            try:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO messages
-                    (conversationId, source, body, sent_at, received_at, type, hasAttachments, attachments_json, isRead)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+        def rows():
+            for conversation_id, message in messages:
+                sent_at = _timestamp_ms(message.timestamp)
+                row = (
                     conversation_id,
                     message.sender,
                     message.body,
                     sent_at,
-                    received_at,
-                    msg_type,
+                    sent_at,  # Use sent_at as received_at for imported messages
+                    "outgoing" if message.is_outgoing else "incoming",
                     1 if message.attachments else 0,
-                    attachments_json,
+                    _pack_attachments(message.attachments) if message.attachments else None,
                     1  # Mark imported messages as read
-                ))
-                if cursor.rowcount > 0:
-                    inserted += 1
-            except sqlite3.Error:
-                continue
-
-        conn.commit()
-        return inserted
+                )
+                if with_hash:
+                    row += (_dedup_hash(conversation_id, sent_at, message.sender, message.body),)
+                yield row
+
+        # One explicit transaction around the whole batch: in autocommit
+        # mode each row would otherwise commit individually, and even in
+        # legacy mode this pins the write lock for the burst
+        with self._write_lock:
+            own_txn = not self._in_transaction and not conn.in_transaction
+            try:
+                if own_txn:
+                    cursor.execute("BEGIN IMMEDIATE")
+                # One prepared statement driven from C; rowcount accumulates the
+                # rows actually inserted (duplicates are ignored)
+                cursor.executemany(insert_sql, rows())
+                inserted = cursor.rowcount
+            except self._db.Error:
+                if own_txn and conn.in_transaction:
+                    conn.rollback()
+                return 0
+
+            if own_txn:
+                conn.commit()
+            else:
+                self._commit(conn)
+        return max(inserted, 0)
 
     def get_message_count(self) -> int:
         """Get total number of messages in the database."""
@@ -691,29 +1415,47 @@ class MessageStore:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        for contact in contacts:
-            number = contact.get("number") or ""
-            if not number:
-                continue
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO contacts (number, name, profile_name, uuid, is_blocked)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                number,
+        rows = [
+            (
+                contact.get("number") or "",
                 contact.get("name") or contact.get("nickName") or "",
                 contact.get("givenName") or contact.get("profile_name") or "",
                 contact.get("uuid") or "",
                 1 if contact.get("isBlocked") else 0
-            ))
+            )
+            for contact in contacts
+            if contact.get("number")
+        ]
+        with self._write_lock:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO contacts (number, name, profile_name, uuid, is_blocked)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
 
-        # Update cache timestamp
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache_meta (key, value)
-            VALUES ('contacts_updated', ?)
-        """, (datetime.now().isoformat(),))
+            # Update cache timestamp
+            cursor.execute("""
+                INSERT OR REPLACE INTO cache_meta (key, value)
+                VALUES ('contacts_updated', ?)
+            """, (datetime.now().isoformat(),))
 
-        conn.commit()
+            self._commit(conn)
+
+    def iter_contacts(self) -> Iterator[dict]:
+        """Stream cached contacts straight off the cursor."""
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "SELECT number, name, profile_name, uuid, is_blocked FROM contacts"
+        )
+        cursor.row_factory = None
+
+        for (number, name, profile_name, uuid, is_blocked) in cursor:
+            yield {
+                "number": number,
+                "name": name,
+                "givenName": profile_name,
+                "uuid": uuid,
+                "isBlocked": bool(is_blocked)
+            }
 
     def get_contacts(self) -> list[dict]:
         """
@@ -722,21 +1464,7 @@ class MessageStore:
         Returns:
             List of contact dicts
         """
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM contacts")
-
-        contacts = []
-        for row in cursor.fetchall():
-            contacts.append({
-                "number": row["number"],
-                "name": row["name"],
-                "givenName": row["profile_name"],
-                "uuid": row["uuid"],
-                "isBlocked": bool(row["is_blocked"])
-            })
-
-        return contacts
+        return list(self.iter_contacts())
 
     def save_groups(self, groups: list[dict]) -> None:
         """
@@ -748,51 +1476,46 @@ class MessageStore:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        for group in groups:
-            group_id = group.get("id") or ""
-            if not group_id:
-                continue
-
-            cursor.execute("""
+        rows = [
+            (
+                group.get("id") or "",
+                group.get("name") or "Unknown Group",
+                _json_dumps(group)
+            )
+            for group in groups
+            if group.get("id")
+        ]
+        with self._write_lock:
+            cursor.executemany("""
                 INSERT OR REPLACE INTO groups (id, name, data_json)
                 VALUES (?, ?, ?)
-            """, (
-                group_id,
-                group.get("name") or "Unknown Group",
-                json.dumps(group)
-            ))
+            """, rows)
 
-        # Update cache timestamp
-        cursor.execute("""
-            INSERT OR REPLACE INTO cache_meta (key, value)
-            VALUES ('groups_updated', ?)
-        """, (datetime.now().isoformat(),))
+            # Update cache timestamp
+            cursor.execute("""
+                INSERT OR REPLACE INTO cache_meta (key, value)
+                VALUES ('groups_updated', ?)
+            """, (datetime.now().isoformat(),))
 
-        conn.commit()
+            self._commit(conn)
+
+    def iter_groups(self) -> Iterator[CachedGroup]:
+        """Stream cached groups as lazy CachedGroup views."""
+        conn = self._get_conn()
+        cursor = conn.execute("SELECT id, name, data_json FROM groups")
+        cursor.row_factory = None
+        for (gid, name, blob) in cursor:
+            yield CachedGroup(gid, name, blob)
 
-    def get_groups(self) -> list[dict]:
+    def get_groups(self) -> list[CachedGroup]:
         """
         Get all cached groups.
 
         Returns:
-            List of group dicts
+            List of dict-like CachedGroup views; the stored payload is
+            only parsed for callers that reach past id/name.
         """
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM groups")
-
-        groups = []
-        for row in cursor.fetchall():
-            if row["data_json"]:
-                try:
-                    group = json.loads(row["data_json"])
-                    groups.append(group)
-                except json.JSONDecodeError:
-                    groups.append({"id": row["id"], "name": row["name"]})
-            else:
-                groups.append({"id": row["id"], "name": row["name"]})
-
-        return groups
+        return list(self.iter_groups())
 
     def has_contact_cache(self) -> bool:
         """Check if contact cache exists."""
@@ -6,20 +6,38 @@ command-line invocation and JSON-RPC daemon mode.
 """
 
 import asyncio
+import concurrent.futures
 import json
+import re
+import selectors
+import socket
 import subprocess
 import shutil
 import os
 import sys
+import tempfile
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Callable, AsyncIterator
+from typing import Optional, Callable
 from pathlib import Path
 import threading
 import queue
 
+# orjson parses signal-cli's newline-delimited JSON output much faster than
+# the stdlib module and accepts bytes directly; fall back when unavailable.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+# E.164-style phone number as printed in signal-cli link output
+_PHONE_RE = re.compile(r"\+\d+")
+
+
+@dataclass(slots=True)
 class Contact:
     """Represents a Signal contact."""
     number: str
@@ -33,17 +51,19 @@ class Contact:
         return self.name or self.profile_name or self.number
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a Signal message."""
     sender: str
     sender_name: str
     body: str
-    timestamp: datetime
+    timestamp: "datetime | int"  # datetime, or raw ms since epoch on bulk paths
     is_outgoing: bool = False
     group_id: str = ""
     group_name: str = ""
-    attachments: list = field(default_factory=list)
+    # Immutable empty default; callers pass a list or tuple when there are
+    # attachments, so no per-message empty list gets allocated
+    attachments: "list | tuple" = ()
     is_read: bool = False
 
     @property
@@ -52,8 +72,21 @@ class Message:
             return "You"
         return self.sender_name or self.sender
 
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Timestamp as a datetime, converting (and caching) raw epoch ms.
 
-@dataclass
+        Bulk paths store the wire timestamp unconverted; the datetime is
+        only materialized when something actually formats or compares it.
+        """
+        ts = self.timestamp
+        if isinstance(ts, int):
+            ts = datetime.fromtimestamp(ts / 1000)
+            self.timestamp = ts
+        return ts
+
+
+@dataclass(slots=True)
 class Conversation:
     """Represents a conversation (contact or group)."""
     id: str  # Phone number or group ID
@@ -65,6 +98,51 @@ class Conversation:
     messages: list = field(default_factory=list)
 
 
+class ContactCache:
+    """Bounded LRU cache of Contact objects keyed by phone number.
+
+    A long-running session can encounter arbitrarily many senders
+    (especially in large groups); capping the cache keeps memory flat
+    while recently active contacts stay resident.
+    """
+
+    def __init__(self, max_size: int = 2048):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Contact]" = OrderedDict()
+
+    def get(self, number: str, default=None) -> Optional[Contact]:
+        contact = self._entries.get(number)
+        if contact is None:
+            return default
+        self._entries.move_to_end(number)
+        return contact
+
+    def __getitem__(self, number: str) -> Contact:
+        contact = self._entries[number]
+        self._entries.move_to_end(number)
+        return contact
+
+    def __setitem__(self, number: str, contact: Contact) -> None:
+        entries = self._entries
+        if number in entries:
+            entries.move_to_end(number)
+        entries[number] = contact
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
+
+    def __contains__(self, number: str) -> bool:
+        return number in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def values(self) -> list:
+        return list(self._entries.values())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class SignalCliError(Exception):
     """Exception raised for signal-cli errors."""
     pass
@@ -86,22 +164,51 @@ class SignalClient:
         self.phone_number = phone_number
         self.config_dir = config_dir or str(Path.home() / ".local" / "share" / "signal-cli")
         self.cli_path = cli_path
+        # is_installed/get_version results never change mid-run, but the UI
+        # calls them on screen transitions; cache per instance
+        self._installed_cache: Optional[bool] = None
+        self._version_cache: Optional[str] = None
         self._daemon_process: Optional[subprocess.Popen] = None
         self._message_callbacks: list[Callable] = []
         self._message_queue: queue.Queue = queue.Queue()
         self._receive_thread: Optional[threading.Thread] = None
         self._running = False
 
+        # JSON-RPC daemon state. The socket is created lazily on first use;
+        # if the daemon can't be started we fall back to one-shot CLI calls.
+        self._socket_path = Path(tempfile.gettempdir()) / f"signal-tui-{os.getpid()}.sock"
+        self._rpc_sock: Optional[socket.socket] = None
+        self._rpc_file = None
+        self._rpc_lock = threading.Lock()
+        self._rpc_id = 0
+        self._daemon_failed = False
+        # A single reader thread owns the socket's read side: it files RPC
+        # responses into _rpc_responses (guarded by _rpc_cond) and pushes
+        # incoming-message notifications straight to callbacks/_message_queue.
+        self._rpc_responses: dict = {}
+        self._rpc_cond = threading.Condition()
+        self._reader_thread: Optional[threading.Thread] = None
+
         # Cache
-        self._contacts: dict[str, Contact] = {}
+        self._contacts = ContactCache()
+        self._contacts_loaded = False
         self._conversations: dict[str, Conversation] = {}
 
     def is_installed(self) -> bool:
-        """Check if signal-cli is installed and accessible."""
-        return shutil.which(self.cli_path) is not None
+        """Check if signal-cli is installed and accessible (cached)."""
+        if self._installed_cache is None:
+            # Absolute executable path: one access() check beats walking
+            # every $PATH directory through shutil.which
+            if os.path.isabs(self.cli_path) and os.access(self.cli_path, os.X_OK):
+                self._installed_cache = True
+            else:
+                self._installed_cache = shutil.which(self.cli_path) is not None
+        return self._installed_cache
 
     def get_version(self) -> str:
-        """Get signal-cli version."""
+        """Get signal-cli version (cached — spawning the JVM takes ~1s)."""
+        if self._version_cache is not None:
+            return self._version_cache
         try:
             result = subprocess.run(
                 [self.cli_path, "--version"],
@@ -109,9 +216,10 @@ class SignalClient:
                 text=True,
                 timeout=10
             )
-            return result.stdout.strip()
+            self._version_cache = result.stdout.strip()
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return "unknown"
+        return self._version_cache
 
     def _run_command(self, args: list[str], timeout: int = 30) -> dict:
         """Run a signal-cli command and return parsed JSON output."""
@@ -127,47 +235,352 @@ class SignalClient:
         cmd.extend(args)
 
         try:
+            # Keep the output as bytes: decoding the whole stream to str
+            # just to re-encode it inside the JSON parser is wasted work,
+            # and orjson consumes bytes natively.
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() or result.stdout.strip()
+                error_msg = (result.stderr or result.stdout).decode("utf-8", "replace").strip()
                 raise SignalCliError(f"Command failed: {error_msg}")
 
-            if result.stdout.strip():
+            stdout = result.stdout.strip()
+            if stdout:
                 # Handle multiple JSON objects (one per line)
-                lines = result.stdout.strip().split('\n')
+                lines = stdout.split(b'\n')
                 if len(lines) == 1:
-                    return json.loads(lines[0])
-                return [json.loads(line) for line in lines if line.strip()]
+                    return _json_loads(lines[0])
+                return [_json_loads(line) for line in lines if line.strip()]
 
             return {}
 
         except subprocess.TimeoutExpired:
             raise SignalCliError("Command timed out")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             raise SignalCliError(f"Invalid JSON response: {e}")
         except FileNotFoundError:
             raise SignalCliNotFoundError("signal-cli not found. Please install it first.")
 
+    def _run_command_streaming(self, args: list[str], timeout: int = 30):
+        """Run a signal-cli command, yielding each ND-JSON object as emitted.
+
+        Unlike _run_command this doesn't buffer the whole stdout until the
+        process exits, so callers can start handling the first object while
+        signal-cli is still producing the rest.
+        """
+        cmd = [self.cli_path]
+
+        if self.config_dir:
+            cmd.extend(["--config", self.config_dir])
+
+        if self.phone_number:
+            cmd.extend(["-u", self.phone_number])
+
+        cmd.append("--output=json")
+        cmd.extend(args)
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise SignalCliNotFoundError("signal-cli not found. Please install it first.")
+
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _json_loads(line)
+                except ValueError:
+                    continue
+        finally:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    # JVM startup dominates the cost of every one-shot signal-cli call, so
+    # we keep a single daemon process alive and talk JSON-RPC to it over a
+    # unix socket. All command methods try the socket first and fall back to
+    # _run_command when the daemon is unavailable.
+
+    DAEMON_CONNECT_TIMEOUT = 15.0
+
+    def _ensure_daemon(self) -> bool:
+        """Start the signal-cli daemon (once) and connect to its socket.
+
+        Returns True when the JSON-RPC socket is usable. A failed startup is
+        remembered so we don't re-pay the spawn attempt on every call.
+        """
+        if self._rpc_file is not None:
+            return True
+        if self._daemon_failed or not self.phone_number:
+            return False
+
+        if self._daemon_process is None or self._daemon_process.poll() is not None:
+            cmd = [self.cli_path]
+            if self.config_dir:
+                cmd.extend(["--config", self.config_dir])
+            cmd.extend(["-u", self.phone_number, "daemon", "--socket", str(self._socket_path)])
+            try:
+                self._daemon_process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError:
+                self._daemon_failed = True
+                return False
+
+        # The daemon takes a moment to create the socket; poll until it
+        # accepts a connection or dies.
+        deadline = time.monotonic() + self.DAEMON_CONNECT_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._daemon_process.poll() is not None:
+                break
+            try:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(str(self._socket_path))
+                self._rpc_sock = sock
+                self._rpc_file = sock.makefile("rwb")
+                self._reader_thread = threading.Thread(
+                    target=self._socket_reader, daemon=True
+                )
+                self._reader_thread.start()
+                return True
+            except OSError:
+                time.sleep(0.2)
+
+        self._daemon_failed = True
+        self._stop_daemon()
+        return False
+
+    def _stop_daemon(self) -> None:
+        """Tear down the RPC socket and daemon process."""
+        if self._rpc_file is not None:
+            try:
+                self._rpc_file.close()
+            except OSError:
+                pass
+            self._rpc_file = None
+        if self._rpc_sock is not None:
+            try:
+                self._rpc_sock.close()
+            except OSError:
+                pass
+            self._rpc_sock = None
+        if self._daemon_process is not None:
+            if self._daemon_process.poll() is None:
+                self._daemon_process.terminate()
+                try:
+                    self._daemon_process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._daemon_process.kill()
+            self._daemon_process = None
+        with self._rpc_cond:
+            self._rpc_responses.clear()
+            self._rpc_cond.notify_all()
+        if self._reader_thread is not None and self._reader_thread is not threading.current_thread():
+            self._reader_thread.join(timeout=2)
+        self._reader_thread = None
+
+    def _rpc_send(self, payload) -> None:
+        """Write one newline-delimited JSON frame to the daemon socket."""
+        data = json.dumps(payload).encode("utf-8") + b"\n"
+        try:
+            self._rpc_file.write(data)
+            self._rpc_file.flush()
+        except OSError as e:
+            self._stop_daemon()
+            raise SignalCliError(f"Daemon write failed: {e}")
+
+    def _socket_reader(self) -> None:
+        """Read frames off the daemon socket until it closes.
+
+        RPC responses are filed by id for _rpc_read_until; "receive"
+        notifications are parsed and dispatched immediately, so incoming
+        messages arrive as pushes with no polling subprocess involved.
+        """
+        rpc_file = self._rpc_file
+        while True:
+            try:
+                line = rpc_file.readline()
+            except (OSError, ValueError):
+                break
+            if not line:
+                break
+            try:
+                frames = _json_loads(line)
+            except ValueError:
+                continue
+            if not isinstance(frames, list):
+                frames = [frames]
+            for frame in frames:
+                if "id" in frame and "method" not in frame:
+                    with self._rpc_cond:
+                        self._rpc_responses[frame["id"]] = frame
+                        self._rpc_cond.notify_all()
+                elif frame.get("method") == "receive":
+                    self._dispatch_notification(frame)
+                elif frame.get("method") in ("contactsUpdated", "profileUpdated"):
+                    self._apply_contact_update(frame)
+
+        # Socket gone: wake any caller still waiting on a response
+        with self._rpc_cond:
+            self._rpc_cond.notify_all()
+
+        # The daemon died or the socket was closed under us. Tear down the
+        # RPC state so calls fail over to one-shot CLI commands instead of
+        # degrading via timeouts, then keep messages flowing: give the
+        # daemon one chance to come back, and fall back to the polling
+        # receive loop if it won't.
+        self._stop_daemon()
+        if self._running and self._message_callbacks:
+            time.sleep(1.0)
+            if not self._ensure_daemon():
+                self._start_polling_receiver()
+
+    def _dispatch_notification(self, frame: dict) -> None:
+        """Turn a daemon receive notification into a Message and deliver it."""
+        # The envelope sits directly under params — there is no "result"
+        # wrapper on notifications. Guard for list-shaped params, which
+        # some signal-cli builds use to batch envelopes.
+        params = frame.get("params", {})
+        items = params if isinstance(params, list) else [params]
+        for item in items:
+            message = self._parse_envelope(item)
+            if message is None:
+                continue
+            if self._message_callbacks:
+                for cb in self._message_callbacks:
+                    try:
+                        cb(message)
+                    except Exception as e:
+                        print(f"Message callback error: {e}", file=sys.stderr)
+            else:
+                self._message_queue.put(message)
+
+    def _apply_contact_update(self, frame: dict) -> None:
+        """Apply a contactsUpdated/profileUpdated notification to the cache.
+
+        The notification carries only the changed entries, so we mutate
+        those in place instead of throwing the whole cache away; if the
+        payload has no recognizable entries, fall back to invalidation.
+        """
+        params = frame.get("params", {})
+        entries = params if isinstance(params, list) else params.get("contacts", [])
+        if entries:
+            for item in entries:
+                contact = self._parse_contact(item)
+                if contact.number:
+                    self._contacts[contact.number] = contact
+        else:
+            # Unknown shape: cached names may be stale, refetch lazily
+            self._contacts.clear()
+            self._contacts_loaded = False
+
+    def _rpc_read_until(self, pending_ids: set, timeout: int) -> dict:
+        """Wait until the reader thread has filed a response for every id."""
+        responses = {}
+        deadline = time.monotonic() + timeout
+        with self._rpc_cond:
+            while pending_ids:
+                for frame_id in tuple(pending_ids):
+                    frame = self._rpc_responses.pop(frame_id, None)
+                    if frame is not None:
+                        responses[frame_id] = frame
+                        pending_ids.discard(frame_id)
+                if not pending_ids:
+                    break
+                if self._rpc_file is None:
+                    raise SignalCliError("Daemon closed the connection")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._rpc_cond.wait(remaining):
+                    raise SignalCliError("Daemon response timed out")
+        return responses
+
+    @staticmethod
+    def _rpc_result(frame: dict):
+        """Extract the result from a JSON-RPC response, raising on error."""
+        error = frame.get("error")
+        if error:
+            raise SignalCliError(f"Command failed: {error.get('message', error)}")
+        return frame.get("result", {})
+
+    def _rpc_call(self, method: str, params: Optional[dict] = None, timeout: int = 30):
+        """Issue a single JSON-RPC request and return its result."""
+        with self._rpc_lock:
+            self._rpc_id += 1
+            req_id = self._rpc_id
+            frame = {"jsonrpc": "2.0", "id": req_id, "method": method}
+            if params:
+                frame["params"] = params
+            self._rpc_send(frame)
+            response = self._rpc_read_until({req_id}, timeout)[req_id]
+        return self._rpc_result(response)
+
+    def _rpc_batch(self, calls: list[tuple], timeout: int = 30) -> list:
+        """Issue several JSON-RPC requests as one batch.
+
+        Args:
+            calls: List of (method, params) tuples.
+
+        Returns results in call order; a single socket round-trip replaces
+        one JVM-bound subprocess per call.
+        """
+        with self._rpc_lock:
+            frames = []
+            ids = []
+            for method, params in calls:
+                self._rpc_id += 1
+                frame = {"jsonrpc": "2.0", "id": self._rpc_id, "method": method}
+                if params:
+                    frame["params"] = params
+                frames.append(frame)
+                ids.append(self._rpc_id)
+            self._rpc_send(frames)
+            responses = self._rpc_read_until(set(ids), timeout)
+        return [self._rpc_result(responses[i]) for i in ids]
+
+    def _call(self, method: str, params: Optional[dict], cli_args: list[str], timeout: int = 30):
+        """Dispatch a command via the daemon, falling back to one-shot CLI."""
+        if self._ensure_daemon():
+            try:
+                return self._rpc_call(method, params, timeout=timeout)
+            except SignalCliError:
+                pass  # daemon hiccup; retry via subprocess below
+        return self._run_command(cli_args, timeout=timeout)
+
     def get_linked_accounts(self) -> list[str]:
         """Get list of phone numbers linked to signal-cli."""
-        data_dir = Path(self.config_dir) / "data"
-        if not data_dir.exists():
+        data_dir = os.path.join(self.config_dir, "data")
+
+        # Account files are named with the bare phone number. scandir gives
+        # the file type along with the name, so the whole listing costs one
+        # syscall per batch instead of a stat per entry.
+        try:
+            with os.scandir(data_dir) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith("+")
+                    and "." not in entry.name
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except OSError:
             return []
 
-        accounts = []
-        for item in data_dir.iterdir():
-            if item.is_file() and item.suffix == "":
-                # Account files are named with the phone number
-                name = item.name
-                if name.startswith("+"):
-                    accounts.append(name)
-        return accounts
+    LINK_URI_TIMEOUT = 30.0
 
     def generate_link_uri(self, device_name: str = "Signal TUI") -> str:
         """
@@ -188,7 +601,18 @@ class SignalClient:
             text=True
         )
 
-        # Read the URI (first line of output)
+        # Read the URI (first line of output). A bare readline() would hang
+        # the linking thread forever if signal-cli wedges before printing,
+        # so wait for readability with a deadline.
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout, selectors.EVENT_READ)
+        try:
+            if not sel.select(timeout=self.LINK_URI_TIMEOUT):
+                process.kill()
+                raise SignalCliError("Timed out waiting for link URI")
+        finally:
+            sel.close()
+
         uri_line = process.stdout.readline().strip()
 
         # Store the process so we can wait for linking to complete
@@ -210,14 +634,10 @@ class SignalClient:
 
             if self._link_process.returncode == 0:
                 # Parse the phone number from output
-                # Output format varies, look for the phone number
-                for line in (stdout + stderr).split('\n'):
-                    if '+' in line:
-                        # Extract phone number
-                        import re
-                        match = re.search(r'\+\d+', line)
-                        if match:
-                            return match.group()
+                # Output format varies, so scan the whole thing at once
+                match = _PHONE_RE.search(stdout + stderr)
+                if match:
+                    return match.group()
                 # If linking worked, check for new accounts
                 accounts = self.get_linked_accounts()
                 if accounts:
@@ -229,30 +649,45 @@ class SignalClient:
         finally:
             self._link_process = None
 
-    def list_contacts(self) -> list[Contact]:
-        """Get all contacts."""
+    @staticmethod
+    def _parse_contact(item: dict) -> Contact:
+        """Build a Contact from one signal-cli contact entry."""
+        # Get profile name from givenName or profile.givenName
+        profile_name = item.get("givenName") or ""
+        if not profile_name:
+            profile = item.get("profile", {})
+            if profile:
+                profile_name = profile.get("givenName") or ""
+
+        return Contact(
+            number=item.get("number", ""),
+            name=item.get("name", "") or item.get("nickName", ""),
+            profile_name=profile_name,
+            uuid=item.get("uuid", ""),
+            is_blocked=item.get("isBlocked", False)
+        )
+
+    def list_contacts(self, refresh: bool = False) -> list[Contact]:
+        """Get all contacts.
+
+        The full list is fetched once; afterwards the cache is kept current
+        by contactsUpdated deltas from the daemon, so repeat calls don't
+        re-parse thousands of unchanged entries. Pass refresh=True to force
+        a full re-fetch.
+        """
+        if self._contacts_loaded and not refresh:
+            return self._contacts.values()
+
         try:
-            result = self._run_command(["listContacts"])
+            result = self._call("listContacts", None, ["listContacts"])
 
             contacts = []
             if isinstance(result, list):
                 for item in result:
-                    # Get profile name from givenName or profile.givenName
-                    profile_name = item.get("givenName") or ""
-                    if not profile_name:
-                        profile = item.get("profile", {})
-                        if profile:
-                            profile_name = profile.get("givenName") or ""
-
-                    contact = Contact(
-                        number=item.get("number", ""),
-                        name=item.get("name", "") or item.get("nickName", ""),
-                        profile_name=profile_name,
-                        uuid=item.get("uuid", ""),
-                        is_blocked=item.get("isBlocked", False)
-                    )
+                    contact = self._parse_contact(item)
                     contacts.append(contact)
                     self._contacts[contact.number] = contact
+                self._contacts_loaded = True
 
             return contacts
         except SignalCliError as e:
@@ -262,7 +697,7 @@ class SignalClient:
     def list_groups(self) -> list[dict]:
         """Get all groups."""
         try:
-            result = self._run_command(["listGroups", "-d"])
+            result = self._call("listGroups", {"detailed": True}, ["listGroups", "-d"])
             if isinstance(result, list):
                 return result
             return []
@@ -281,77 +716,106 @@ class SignalClient:
         """
         try:
             args = ["send"]
+            params: dict = {}
 
             # Add message if provided (can be empty when sending only attachments)
             if message:
                 args.extend(["-m", message])
+                params["message"] = message
 
             # Add attachments
             if attachments:
                 for attachment_path in attachments:
                     args.extend(["-a", attachment_path])
+                params["attachments"] = attachments
 
             if group:
                 args.extend(["-g", recipient])
+                params["groupId"] = recipient
             else:
                 args.append(recipient)
+                params["recipient"] = [recipient]
 
-            self._run_command(args)
+            self._call("send", params, args)
             return True
         except SignalCliError as e:
             print(f"Failed to send message: {e}", file=sys.stderr)
             return False
 
+    def _parse_envelope(self, item: dict) -> Optional[Message]:
+        """Parse one signal-cli envelope into a Message (None if not a data message)."""
+        envelope = item.get("envelope", {})
+
+        # Skip non-data messages
+        data_message = envelope.get("dataMessage")
+        if not data_message:
+            return None
+
+        sender = envelope.get("source", "")
+        timestamp_ms = envelope.get("timestamp", 0)
+
+        # Parse attachments
+        attachments = [
+            {
+                "id": att.get("id", ""),
+                "contentType": att.get("contentType", ""),
+                "filename": att.get("filename", ""),
+                "size": att.get("size", 0),
+                "width": att.get("width", 0),
+                "height": att.get("height", 0),
+            }
+            for att in data_message.get("attachments", [])
+        ]
+
+        # Avoid building a throwaway Contact just for its display_name,
+        # and keep the timestamp as raw epoch ms — timestamp_dt converts
+        # lazily if the message is ever rendered.
+        contact = self._contacts.get(sender)
+        return Message(
+            sender=sender,
+            sender_name=contact.display_name if contact is not None else sender,
+            body=data_message.get("message", ""),
+            timestamp=timestamp_ms or int(time.time() * 1000),
+            is_outgoing=False,
+            group_id=data_message.get("groupInfo", {}).get("groupId", ""),
+            attachments=attachments,
+        )
+
     def receive_messages(self, timeout: int = 5) -> list[Message]:
         """
         Receive pending messages.
 
-        This is a blocking call that waits for messages.
+        In daemon mode messages are pushed by the socket reader, so this
+        just drains the delivery queue; otherwise it runs a blocking
+        one-shot `receive` command.
         """
-        try:
-            result = self._run_command(["receive", "--timeout", str(timeout)], timeout=timeout + 10)
-
+        if self._rpc_file is not None:
             messages = []
-            items = result if isinstance(result, list) else [result] if result else []
-
-            for item in items:
-                envelope = item.get("envelope", {})
-
-                # Skip non-data messages
-                data_message = envelope.get("dataMessage")
-                if not data_message:
-                    continue
-
-                sender = envelope.get("source", "")
-                timestamp_ms = envelope.get("timestamp", 0)
-
-                # Parse attachments
-                attachments = []
-                for att in data_message.get("attachments", []):
-                    attachments.append({
-                        "id": att.get("id", ""),
-                        "contentType": att.get("contentType", ""),
-                        "filename": att.get("filename", ""),
-                        "size": att.get("size", 0),
-                        "width": att.get("width", 0),
-                        "height": att.get("height", 0),
-                    })
-
-                message = Message(
-                    sender=sender,
-                    sender_name=self._contacts.get(sender, Contact(sender)).display_name,
-                    body=data_message.get("message", ""),
-                    timestamp=datetime.fromtimestamp(timestamp_ms / 1000) if timestamp_ms else datetime.now(),
-                    is_outgoing=False,
-                    group_id=data_message.get("groupInfo", {}).get("groupId", ""),
-                    attachments=attachments,
-                )
-                messages.append(message)
-
+            try:
+                messages.append(self._message_queue.get(timeout=timeout))
+            except queue.Empty:
+                return []
+            while True:
+                try:
+                    messages.append(self._message_queue.get_nowait())
+                except queue.Empty:
+                    break
             return messages
+
+        try:
+            return list(self._iter_receive(timeout))
         except SignalCliError:
             return []
 
+    def _iter_receive(self, timeout: int):
+        """Yield Messages from a one-shot receive as signal-cli emits them."""
+        for item in self._run_command_streaming(
+            ["receive", "--timeout", str(timeout)], timeout=timeout + 10
+        ):
+            message = self._parse_envelope(item)
+            if message is not None:
+                yield message
+
     def get_attachment_path(self, attachment_id: str) -> Optional[str]:
         """Get the local file path for a downloaded attachment."""
         # signal-cli stores attachments in config_dir/attachments/
@@ -378,17 +842,47 @@ class SignalClient:
         self._running = True
         self._message_callbacks.append(callback)
 
+        if self._ensure_daemon():
+            # Push mode: the socket reader dispatches messages as they
+            # arrive. Anything queued before the callback was registered
+            # is delivered from a short-lived thread rather than the
+            # caller's: callbacks expect a worker thread (the app marshals
+            # to its event loop with call_from_thread, which raises if
+            # invoked from the loop thread itself).
+            def drain_queue():
+                while True:
+                    try:
+                        msg = self._message_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    for cb in self._message_callbacks:
+                        try:
+                            cb(msg)
+                        except Exception as e:
+                            print(f"Message callback error: {e}", file=sys.stderr)
+
+            threading.Thread(target=drain_queue, daemon=True).start()
+            return
+
+        self._start_polling_receiver()
+
+    def _start_polling_receiver(self) -> None:
+        """Start the one-shot-receive polling thread (non-daemon fallback)."""
+        if self._receive_thread is not None and self._receive_thread.is_alive():
+            return
+
         def receive_loop():
             while self._running:
                 try:
-                    messages = self.receive_messages(timeout=10)
-                    for msg in messages:
+                    # Stream: each message is dispatched as soon as
+                    # signal-cli emits it, not when the command exits
+                    for msg in self._iter_receive(timeout=10):
                         for cb in self._message_callbacks:
                             cb(msg)
                 except Exception as e:
                     if self._running:
                         print(f"Receive error: {e}", file=sys.stderr)
-                        asyncio.get_event_loop().call_later(5, lambda: None)  # Wait before retry
+                        time.sleep(5)  # Back off before retrying
 
         self._receive_thread = threading.Thread(target=receive_loop, daemon=True)
         self._receive_thread.start()
@@ -399,6 +893,7 @@ class SignalClient:
         if self._receive_thread:
             self._receive_thread.join(timeout=5)
             self._receive_thread = None
+        self._stop_daemon()
 
     def get_contact_name(self, number: str) -> str:
         """Get display name for a contact."""
@@ -409,7 +904,7 @@ class SignalClient:
     def trust_identity(self, number: str) -> bool:
         """Trust a contact's identity (safety number)."""
         try:
-            self._run_command(["trust", "-a", number])
+            self._call("trust", {"recipient": number, "trustAllKnownKeys": True}, ["trust", "-a", number])
             return True
         except SignalCliError:
             return False
@@ -419,9 +914,18 @@ class SignalClient:
         if not self.phone_number:
             return False
 
+        # A live daemon connection for this account is verification enough
+        if self._ensure_daemon():
+            return True
+
+        # Cheap local check: linked accounts are just files in the data dir
+        if self.phone_number in self.get_linked_accounts():
+            return True
+
         try:
-            # Try to list contacts as a simple verification
-            self._run_command(["listContacts"])
+            # Last resort: an O(1) status probe for our own number, instead
+            # of listing every contact just to get a boolean
+            self._run_command(["getUserStatus", self.phone_number])
             return True
         except SignalCliError:
             return False
@@ -429,7 +933,11 @@ class SignalClient:
     def sync_contacts(self) -> bool:
         """Request contact sync from the primary device."""
         try:
-            self._run_command(["sendSyncRequest"])
+            self._call("sendSyncRequest", None, ["sendSyncRequest"])
+            # Names can change as the sync lands; drop cached entries so
+            # they're re-read from the fresh contact list
+            self._contacts.clear()
+            self._contacts_loaded = False
             return True
         except SignalCliError:
             return False
@@ -437,30 +945,43 @@ class SignalClient:
 
 # Async wrapper for use with Textual
 class AsyncSignalClient:
-    """Async wrapper around SignalClient for use with Textual."""
+    """Async wrapper around SignalClient for use with Textual.
+
+    Blocking calls run on a small dedicated thread pool rather than the
+    loop's default executor: signal-cli work serializes on one subprocess
+    or socket anyway, so a burst of UI calls shouldn't fan out into a pile
+    of threads each spawning a JVM.
+    """
 
     def __init__(self, client: SignalClient):
         self.client = client
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="signal-cli"
+        )
+
+    async def aclose(self) -> None:
+        """Shut down the executor (pending calls are left to finish)."""
+        self._executor.shutdown(wait=False)
 
     async def send_message(self, recipient: str, message: str, group: bool = False, attachments: list[str] = None) -> bool:
         """Send a message asynchronously."""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: self.client.send_message(recipient, message, group, attachments)
         )
 
     async def receive_messages(self, timeout: int = 5) -> list[Message]:
         """Receive messages asynchronously."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.receive_messages, timeout)
+        return await loop.run_in_executor(self._executor, self.client.receive_messages, timeout)
 
-    async def list_contacts(self) -> list[Contact]:
-        """List contacts asynchronously."""
+    async def list_contacts(self, refresh: bool = False) -> list[Contact]:
+        """List contacts asynchronously; refresh bypasses the client cache."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.list_contacts)
+        return await loop.run_in_executor(self._executor, self.client.list_contacts, refresh)
 
     async def list_groups(self) -> list[dict]:
         """List groups asynchronously."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.client.list_groups)
+        return await loop.run_in_executor(self._executor, self.client.list_groups)
@@ -4,8 +4,13 @@ Signal TUI - A terminal user interface for signal-cli
 """
 
 import asyncio
-import threading
+import os
+import tempfile
+from array import array
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Center, Middle
@@ -29,17 +34,45 @@ from signal_client import SignalClient, AsyncSignalClient, Message, Contact, Sig
 from clipboard import grab_clipboard_image, cleanup_temp_attachment, is_clipboard_supported, StagedAttachment
 from message_store import MessageStore
 
-# QR Code generation
+# NumPy vectorizes the matrix-to-text rendering when available
 try:
-    import qrcode
-    HAS_QRCODE = True
+    import numpy as np
+    HAS_NUMPY = True
 except ImportError:
-    HAS_QRCODE = False
+    HAS_NUMPY = False
 
+# Timestamp display formats, hoisted so hot loops hit a LOAD_GLOBAL
+# instead of rebuilding the literal at each call site
+_TIME_FMT = "%I:%M %p"
+_DATE_FMT = "%B %d, %Y"
+_SHORT_DATE_FMT = "%b %d"
 
+@lru_cache(maxsize=1440)  # one entry per distinct wall-clock minute
+def _fmt_time(hour: int, minute: int) -> str:
+    """Format a bubble's clock label without re-running strftime per message."""
+    return datetime(2000, 1, 1, hour, minute).strftime(_TIME_FMT)
+
+
+# Block characters indexed by (top << 1) | bottom. A tuple of prebuilt
+# 1-char strings: indexing a str would allocate a fresh string per cell
+# for these non-latin characters, a tuple just hands back the same object
+_QR_BLOCKS = (" ", "▄", "▀", "█")
+if HAS_NUMPY:
+    _QR_BLOCK_ARR = np.array(_QR_BLOCKS)
+
+
+@lru_cache(maxsize=8)
 def generate_qr_code(data: str) -> str:
-    """Generate an ASCII QR code using Unicode block characters."""
-    if not HAS_QRCODE:
+    """Generate an ASCII QR code using Unicode block characters.
+
+    The result is cached per URI: the linking screen re-renders while
+    waiting for the phone to scan, and the code never changes.
+    """
+    # Deferred import: the already-linked startup path never shows a QR
+    # code, so it shouldn't pay for loading the library
+    try:
+        import qrcode
+    except ImportError:
         return "[QR code library not installed]"
 
     qr = qrcode.QRCode(
@@ -54,25 +87,29 @@ def generate_qr_code(data: str) -> str:
     # Get the QR matrix
     matrix = qr.get_matrix()
 
-    # Use Unicode block characters for compact display
-    # Each character represents 2 vertical pixels
+    # Use Unicode block characters for compact display: each character
+    # represents 2 vertical pixels, selected by (top << 1) | bottom
+    if HAS_NUMPY:
+        grid = np.array(matrix, dtype=np.uint8)
+        if grid.shape[0] % 2:
+            # Odd height: pad a blank pixel row so rows pair up cleanly
+            grid = np.pad(grid, ((0, 1), (0, 0)))
+        chars = _QR_BLOCK_ARR[(grid[0::2] << 1) | grid[1::2]]
+        return "\n".join("".join(row) for row in chars)
+
+    blocks = _QR_BLOCKS
     lines = []
-
-    # Process two rows at a time
-    for y in range(0, len(matrix), 2):
-        line = ""
-        for x in range(len(matrix[0])):
-            top = matrix[y][x] if y < len(matrix) else False
-            bottom = matrix[y + 1][x] if y + 1 < len(matrix) else False
-
-            if top and bottom:
-                line += "█"  # Full block
-            elif top and not bottom:
-                line += "▀"  # Upper half
-            elif not top and bottom:
-                line += "▄"  # Lower half
-            else:
-                line += " "  # Empty
+    height = len(matrix)
+    for y in range(0, height, 2):
+        top_row = matrix[y]
+        bottom_row = matrix[y + 1] if y + 1 < height else None
+        if bottom_row is None:
+            line = "".join(blocks[(top << 1)] for top in top_row)
+        else:
+            line = "".join(
+                blocks[(top << 1) | bottom]
+                for top, bottom in zip(top_row, bottom_row)
+            )
         lines.append(line)
 
     return "\n".join(lines)
@@ -117,9 +154,13 @@ class MessageBubble(Static):
         self.time = time
         self.is_me = is_me
         self.attachments = attachments or []
+        # A bubble's content never changes once built, so render the Panel
+        # once here rather than on every compose — scrolling a long
+        # conversation re-composes widgets but shouldn't re-style text
+        self._rendered = self._render_message()
 
     def compose(self) -> ComposeResult:
-        yield Static(self._render_message())
+        yield Static(self._rendered)
 
     def _render_message(self) -> RenderableType:
         align = "right" if self.is_me else "left"
@@ -214,17 +255,11 @@ class ContactItem(Static):
         self.time = time
         self.unread = unread
         self.is_group = is_group
+        # render() runs on every sidebar redraw; build the Text once and
+        # rebuild only when the preview actually changes
+        self._cached_text = self._build_text()
 
-    def on_click(self) -> None:
-        """Handle click on contact."""
-        self.app.open_conversation(self.contact_id, self.contact_name, self.is_group)
-
-    def on_key(self, event) -> None:
-        """Handle key press on focused contact."""
-        if event.key == "enter":
-            self.app.open_conversation(self.contact_id, self.contact_name, self.is_group)
-
-    def render(self) -> RenderableType:
+    def _build_text(self) -> Text:
         text = Text()
 
         # Icon and name with unread indicator
@@ -242,6 +277,49 @@ class ContactItem(Static):
 
         return text
 
+    def update_preview(self, last_message: str, time: str, unread: int) -> None:
+        """Refresh the preview line when a new message arrives."""
+        self.last_message = last_message
+        self.time = time
+        self.unread = unread
+        self._cached_text = self._build_text()
+        self.refresh()
+
+    def rebind(
+        self,
+        contact_id: str,
+        name: str,
+        last_message: str,
+        time: str,
+        unread: int,
+        is_group: bool,
+    ) -> None:
+        """Rebind this widget to a different contact (pool reuse).
+
+        Named rebind rather than update to avoid shadowing Static.update.
+        """
+        self.contact_id = contact_id
+        self.contact_name = name
+        self.last_message = last_message
+        self.time = time
+        self.unread = unread
+        self.is_group = is_group
+        self._cached_text = self._build_text()
+        self.remove_class("selected")
+        self.refresh()
+
+    def on_click(self) -> None:
+        """Handle click on contact."""
+        self.app.open_conversation(self.contact_id, self.contact_name, self.is_group)
+
+    def on_key(self, event) -> None:
+        """Handle key press on focused contact."""
+        if event.key == "enter":
+            self.app.open_conversation(self.contact_id, self.contact_name, self.is_group)
+
+    def render(self) -> RenderableType:
+        return self._cached_text
+
 
 class StatusBar(Static):
     """Connection status bar."""
@@ -434,6 +512,10 @@ class SetupScreen(Screen):
         self.signal_client = signal_client
         self.link_uri = ""
         self.linking_in_progress = False
+        # Probe once up front: compose can re-run on screen transitions and
+        # shouldn't repeat the PATH lookup or the account-directory scan
+        self._installed = signal_client.is_installed()
+        self._existing_accounts = signal_client.get_linked_accounts() if self._installed else []
 
     def compose(self) -> ComposeResult:
         with Container(id="setup-container"):
@@ -442,7 +524,7 @@ class SetupScreen(Screen):
             yield Rule()
 
             # Check for signal-cli
-            if not self.signal_client.is_installed():
+            if not self._installed:
                 yield Static("signal-cli not found!", id="error-text")
                 yield Static(
                     "Please install signal-cli first:\n"
@@ -454,7 +536,7 @@ class SetupScreen(Screen):
                 return
 
             # Check for existing accounts
-            existing = self.signal_client.get_linked_accounts()
+            existing = self._existing_accounts
             if existing:
                 yield Static("Existing Linked Accounts", classes="section-header")
                 with Container(id="existing-accounts"):
@@ -488,10 +570,19 @@ class SetupScreen(Screen):
             yield LoadingIndicator(id="loading")
 
     def on_mount(self) -> None:
+        # Resolve the widgets once; every update below reuses these refs
+        # instead of walking the DOM per call. They may not exist if
+        # signal-cli is not installed (compose shows the error layout).
         try:
-            self.query_one("#loading", LoadingIndicator).display = False
+            self._w_loading = self.query_one("#loading", LoadingIndicator)
+            self._w_status = self.query_one("#status-text", Static)
+            self._w_generate_btn = self.query_one("#generate-link-btn", Button)
+            self._w_qr_container = self.query_one("#qr-container", Container)
+            self._w_qr_code = self.query_one("#qr-code", Static)
+            self._w_link_uri = self.query_one("#link-uri", Static)
+            self._w_loading.display = False
         except Exception:
-            pass  # Loading indicator may not exist if signal-cli not installed
+            self._w_loading = None
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         button_id = event.button.id
@@ -512,14 +603,13 @@ class SetupScreen(Screen):
             return
 
         self.linking_in_progress = True
-        self.query_one("#loading", LoadingIndicator).display = True
-        self.query_one("#status-text", Static).update("Generating link code...")
-        self.query_one("#generate-link-btn", Button).disabled = True
+        self._w_loading.display = True
+        self._w_status.update("Generating link code...")
+        self._w_generate_btn.disabled = True
 
-        # Run linking in background thread
-        import threading
-        thread = threading.Thread(target=self._do_linking_thread, daemon=True)
-        thread.start()
+        # Run linking on a worker thread (reuses Textual's pool instead
+        # of constructing a fresh Thread)
+        self.run_worker(self._do_linking_thread, thread=True, exclusive=False)
 
     def _do_linking_thread(self) -> None:
         """Background thread for device linking."""
@@ -549,27 +639,28 @@ class SetupScreen(Screen):
         """Update the UI with the link URI and QR code."""
         # Generate and display QR code
         qr_text = generate_qr_code(uri)
-        qr_container = self.query_one("#qr-container", Container)
-        qr_container.add_class("visible")
-        self.query_one("#qr-code", Static).update(qr_text)
+        self._w_qr_container.add_class("visible")
+        self._w_qr_code.update(qr_text)
 
         # Show truncated URI as backup
         if len(uri) > 60:
             display_uri = uri[:60] + "..."
         else:
             display_uri = uri
-        self.query_one("#link-uri", Static).update(
+        self._w_link_uri.update(
             f"[dim]Link URI:[/dim] [cyan]{display_uri}[/cyan]"
         )
-        self.query_one("#status-text", Static).update(
+        self._w_status.update(
             "[yellow]Scan the QR code above with Signal on your phone...[/yellow]"
         )
 
     def linking_success(self, phone: str) -> None:
         """Handle successful linking."""
         self.linking_in_progress = False
-        self.query_one("#loading", LoadingIndicator).display = False
-        self.query_one("#status-text", Static).update(
+        # The account list on disk just changed; re-scan if compose re-runs
+        self._existing_accounts = self.signal_client.get_linked_accounts()
+        self._w_loading.display = False
+        self._w_status.update(
             f"[green]Successfully linked to {phone}![/green]"
         )
 
@@ -589,9 +680,9 @@ class SetupScreen(Screen):
     def linking_failed(self, error: str) -> None:
         """Handle linking failure."""
         self.linking_in_progress = False
-        self.query_one("#loading", LoadingIndicator).display = False
-        self.query_one("#generate-link-btn", Button).disabled = False
-        self.query_one("#status-text", Static).update(f"[red]Error: {error}[/red]")
+        self._w_loading.display = False
+        self._w_generate_btn.disabled = False
+        self._w_status.update(f"[red]Error: {error}[/red]")
 
     def use_existing_account(self, phone: str) -> None:
         """Use an existing linked account."""
@@ -612,11 +703,45 @@ class ContactsList(ScrollableContainer):
 
     selected_index = reactive(0)
 
+    # Below this size the plain Python filter wins; above it the blob
+    # scan's fixed setup cost pays for itself
+    VECTOR_FILTER_MIN = 2000
+
+    # Idle ContactItems kept for reuse; beyond this they are removed for
+    # real so a one-off broad filter doesn't pin widgets forever
+    POOL_MAX = 50
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.all_contacts: list[tuple] = []  # All contacts (id, name, last_msg, time, unread, is_group)
         self.filtered_contacts: list[tuple] = []  # Currently displayed (filtered) contacts
         self._search_term: str = ""
+        # id → position in all_contacts, so single-contact updates don't
+        # have to scan the whole list
+        self._index: dict[str, int] = {}
+        # Parallel (name_lower, id_lower) list so each keystroke filters
+        # with plain substring checks instead of N .lower() allocations
+        self._search_index: list[tuple[str, str]] = []
+        self._filtered_index: list[tuple[str, str]] = []
+        # For very large lists: one contiguous bytes buffer of all rows
+        # plus sorted row-start offsets, so a full scan is a handful of
+        # C-level bytes.find calls instead of N Python substring tests.
+        # Row order is frozen at build time; _blob_ids maps a blob row
+        # back to a contact id regardless of later reordering.
+        self._names_blob: Optional[bytes] = None
+        self._blob_starts: Optional[array] = None
+        self._blob_ids: list[str] = []
+        # Widgets currently mounted, by contact id — _render_contacts
+        # reconciles against this instead of tearing everything down
+        self._mounted_by_id: dict[str, ContactItem] = {}
+        self._selected_item: Optional[ContactItem] = None
+        self._last_render_sig: Optional[int] = None
+        # Hidden widgets parked for reuse — rebinding one is much cheaper
+        # than constructing and registering a fresh ContactItem
+        self._pool: list[ContactItem] = []
+        # Visible items in display order, maintained by _render_contacts
+        # so keyboard navigation doesn't run a CSS query per keypress
+        self._items: list[ContactItem] = []
 
     def compose(self) -> ComposeResult:
         # Initially empty, populated by load_contacts
@@ -627,26 +752,173 @@ class ContactsList(ScrollableContainer):
         self.all_contacts = contacts
         self.filtered_contacts = contacts
         self._search_term = ""
+        # Lowercase names/ids once; filter_contacts reuses these on every
+        # keystroke. c[0] is the id (phone number), c[1] is the name.
+        self._search_index = [
+            ((c[1] or "").lower(), (c[0] or "").lower()) for c in contacts
+        ]
+        self._filtered_index = self._search_index
+        self._index = {c[0]: i for i, c in enumerate(contacts)}
+        if len(contacts) >= self.VECTOR_FILTER_MIN:
+            # CPython's bytes.find is a tuned two-way search; scanning one
+            # fat buffer beats a Python loop once the list is big enough.
+            # \x1f joins the name/id fields within a row, \x00 separates
+            # rows; neither occurs in typed search terms, and candidate
+            # rows are re-verified anyway.
+            parts = []
+            starts = array("i")
+            pos = 0
+            for name_l, id_l in self._search_index:
+                row = (name_l + "\x1f" + id_l).encode()
+                starts.append(pos)
+                parts.append(row)
+                pos += len(row) + 1
+            self._names_blob = b"\x00".join(parts)
+            self._blob_starts = starts
+            self._blob_ids = [c[0] for c in contacts]
+        else:
+            self._names_blob = None
+            self._blob_starts = None
+            self._blob_ids = []
         self._render_contacts()
 
+    def update_contact(
+        self,
+        cid: str,
+        *,
+        last_message: Optional[str] = None,
+        time: Optional[str] = None,
+        unread: Optional[int] = None,
+        unread_delta: int = 0,
+        timestamp: Optional[int] = None,
+    ) -> bool:
+        """Update a single contact's sidebar row in place.
+
+        The id index makes the lookup O(1), and the reconciler then only
+        touches the one changed ContactItem — no database round trip and
+        no full list rebuild per incoming message. Passing a timestamp
+        moves the contact to the top of the list (newest-first order).
+        Returns False when the contact isn't known, in which case the
+        caller should fall back to a full rebuild.
+        """
+        i = self._index.get(cid)
+        if i is None:
+            return False
+        c = self.all_contacts[i]
+        new_unread = c[4] if unread is None else unread
+        row = (
+            c[0],
+            c[1],
+            c[2] if last_message is None else last_message,
+            c[3] if time is None else time,
+            new_unread + unread_delta,
+            c[5],
+            c[6] if timestamp is None else timestamp,
+        )
+        if row == c:
+            return True
+
+        filtered_shared = self.filtered_contacts is self.all_contacts
+        self.all_contacts[i] = row
+        if timestamp is not None and i > 0:
+            # Keep the parallel search index aligned while bubbling the
+            # row to the front, then rebuild the position map once
+            self.all_contacts.insert(0, self.all_contacts.pop(i))
+            self._search_index.insert(0, self._search_index.pop(i))
+            self._index = {c[0]: j for j, c in enumerate(self.all_contacts)}
+
+        if not filtered_shared:
+            # An active search holds a separate (small) subset; fix up the
+            # matching row there too so the visible list stays consistent
+            for fi, fc in enumerate(self.filtered_contacts):
+                if fc[0] == cid:
+                    self.filtered_contacts[fi] = row
+                    if timestamp is not None and fi > 0:
+                        self.filtered_contacts.insert(0, self.filtered_contacts.pop(fi))
+                        self._filtered_index.insert(0, self._filtered_index.pop(fi))
+                    break
+
+        self._render_contacts()
+        return True
+
     def filter_contacts(self, search_term: str) -> None:
         """Filter contacts by search term."""
-        self._search_term = search_term.lower().strip()
+        prev_term = self._search_term
+        term = search_term.lower().strip()
+        self._search_term = term
 
-        if not self._search_term:
+        if not term:
             self.filtered_contacts = self.all_contacts
+            self._filtered_index = self._search_index
         else:
-            self.filtered_contacts = [
-                c for c in self.all_contacts
-                if (c[1] and self._search_term in c[1].lower())  # c[1] is the name
-                or (c[0] and self._search_term in c[0].lower())  # c[0] is the id (phone number)
-            ]
+            # Typing usually extends the previous term, in which case the
+            # new result set is a subset of the old one — narrow the
+            # previous matches instead of rescanning every contact
+            narrowing = prev_term and term.startswith(prev_term)
+
+            if self._names_blob is not None and not narrowing:
+                # Scan the fat buffer once, mapping each hit back to its
+                # row via the offset table, then jump to the next row so
+                # repeated hits in one name cost nothing
+                blob = self._names_blob
+                starts = self._blob_starts
+                needle = term.encode()
+                hit_ids = []
+                pos = blob.find(needle)
+                while pos != -1:
+                    row = bisect_right(starts, pos) - 1
+                    hit_ids.append(self._blob_ids[row])
+                    if row + 1 >= len(starts):
+                        break
+                    pos = blob.find(needle, starts[row + 1])
+
+                # Map blob rows to current positions (the list may have
+                # been reordered since the blob was built) and re-verify:
+                # a multi-byte needle can straddle a separator
+                index = self._index
+                search_index = self._search_index
+                all_contacts = self.all_contacts
+                matches = sorted(
+                    i for i in (index.get(cid) for cid in hit_ids)
+                    if i is not None
+                    and (term in search_index[i][0] or term in search_index[i][1])
+                )
+                self.filtered_contacts = [all_contacts[i] for i in matches]
+                self._filtered_index = [search_index[i] for i in matches]
+            else:
+                if narrowing:
+                    candidates = zip(self.filtered_contacts, self._filtered_index)
+                else:
+                    candidates = zip(self.all_contacts, self._search_index)
+
+                filtered = []
+                filtered_index = []
+                for contact, entry in candidates:
+                    if term in entry[0] or term in entry[1]:
+                        filtered.append(contact)
+                        filtered_index.append(entry)
+                self.filtered_contacts = filtered
+                self._filtered_index = filtered_index
 
         self.selected_index = 0
         self._render_contacts()
 
     def _render_contacts(self) -> None:
-        """Render the current filtered contacts list."""
+        """Reconcile mounted widgets against the current filtered contacts.
+
+        Only the delta is touched: widgets that fell out of the filter are
+        removed, newly matching contacts are mounted in one batch, changed
+        previews are updated in place, and order is fixed up only when it
+        actually differs. A keystroke that narrows the list by one contact
+        costs one removal instead of a full teardown/remount.
+        """
+        # Nothing to do if the visible rows would be identical — e.g. a
+        # keystroke (or trailing space) that didn't change the matches
+        sig = hash((tuple(self.filtered_contacts), self._search_term))
+        if sig == self._last_render_sig:
+            return
+        self._last_render_sig = sig
+
         # Remove loading message if present
         try:
             loading = self.query_one("#contacts-loading", Static)
@@ -654,41 +926,94 @@ class ContactsList(ScrollableContainer):
         except Exception:
             pass
 
-        # Clear existing contacts
-        for item in self.query(".contact-item"):
+        # Remove no-results message if present
+        for item in self.query(".no-results"):
             item.remove()
 
+        mounted = self._mounted_by_id
+
         # Show message if no contacts match
         if not self.filtered_contacts:
+            for item in mounted.values():
+                self._recycle(item)
+            mounted.clear()
+            self._selected_item = None
+            self._items = []
             if self._search_term:
                 self.mount(Static(f"No contacts match '{self._search_term}'", classes="no-results"))
             else:
                 self.mount(Static("No contacts", classes="no-results"))
             return
 
-        # Remove no-results message if present
-        for item in self.query(".no-results"):
+        # Park widgets whose contacts fell out of the filter in the pool
+        new_ids = {c[0] for c in self.filtered_contacts}
+        for cid in list(mounted):
+            if cid not in new_ids:
+                item = mounted.pop(cid)
+                if item is self._selected_item:
+                    self._selected_item = None
+                self._recycle(item)
+
+        # Reuse pooled widgets for missing contacts, mount the remainder
+        # in one batch; refresh changed previews in place
+        to_mount = []
+        for (cid, name, msg, time, unread, is_group, _) in self.filtered_contacts:
+            item = mounted.get(cid)
+            if item is None:
+                if self._pool:
+                    item = self._pool.pop()
+                    item.rebind(cid, name, msg, time, unread, is_group)
+                    item.display = True
+                else:
+                    item = ContactItem(cid, name, msg, time, unread, is_group)
+                    item.add_class("contact-item")
+                    to_mount.append(item)
+                mounted[cid] = item
+            elif (item.last_message, item.time, item.unread) != (msg, time, unread):
+                item.update_preview(msg, time, unread)
+        if to_mount:
+            self.mount_all(to_mount)
+
+        # Restore display order only if it changed. Hidden pool widgets
+        # still occupy child slots, so order via widget anchors rather
+        # than absolute indexes.
+        desired = [mounted[c[0]] for c in self.filtered_contacts]
+        current = [w for w in self.children if isinstance(w, ContactItem) and w.display]
+        if current != desired:
+            self.move_child(desired[0], before=0)
+            for prev, widget in zip(desired, desired[1:]):
+                self.move_child(widget, after=prev)
+
+        self._items = desired
+        self._set_selected(desired[0])
+
+    def _recycle(self, item: "ContactItem") -> None:
+        """Hide a widget and park it for reuse instead of unmounting it."""
+        if len(self._pool) < self.POOL_MAX:
+            item.display = False
+            self._pool.append(item)
+        else:
             item.remove()
 
-        # Add filtered contacts
-        for i, (cid, name, msg, time, unread, is_group, _) in enumerate(self.filtered_contacts):
-            contact = ContactItem(cid, name, msg, time, unread, is_group)
-            contact.add_class("contact-item")
-            if i == 0:
-                contact.add_class("selected")
-            self.mount(contact)
+    def _set_selected(self, item: "ContactItem") -> None:
+        """Move the selected class between widgets without a full sweep."""
+        previous = self._selected_item
+        if previous is item:
+            return
+        if previous is not None:
+            previous.remove_class("selected")
+        item.add_class("selected")
+        self._selected_item = item
 
     def select_contact(self, index: int) -> None:
         """Select a contact by index."""
-        contacts = list(self.query(".contact-item"))
+        contacts = self._items
         if 0 <= index < len(contacts):
-            for i, contact in enumerate(contacts):
-                contact.remove_class("selected")
-                if i == index:
-                    contact.add_class("selected")
+            target = contacts[index]
+            self._set_selected(target)
             self.selected_index = index
-            self.scroll_to_widget(contacts[index])
-            contacts[index].focus()
+            self.scroll_to_widget(target)
+            target.focus()
 
     def get_selected_contact(self) -> Optional[tuple]:
         """Get the currently selected contact."""
@@ -698,78 +1023,173 @@ class ContactsList(ScrollableContainer):
 
 
 class ChatMessages(ScrollableContainer):
-    """Container for chat messages."""
+    """Container for chat messages.
+
+    Bubbles are mounted in a window rather than all at once: opening a
+    conversation mounts only roughly one screenful (plus overscan) of the
+    newest messages, and scrolling towards the top mounts older ones in
+    steps. The rest of the conversation stays as plain Message objects in
+    ``self.messages``, so layout cost tracks the view, not the history.
+    """
 
     MAX_MESSAGES = 100  # Limit displayed messages
+    INITIAL_WINDOW = 30  # Bubbles mounted up front: ~one screen + overscan
+    WINDOW_STEP = 30  # Older bubbles mounted per scroll-to-top
+    NEAR_TOP = 4  # scroll_y threshold (rows) that triggers mounting more
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.messages: list[Message] = []
         self.conversation_id: Optional[str] = None
+        # Index into self.messages of the oldest mounted bubble; everything
+        # before it exists only as data until the user scrolls up
+        self._mounted_from = 0
+        # Topmost date divider currently mounted, so extending the window
+        # upwards can drop a divider that would otherwise repeat
+        self._top_divider: Optional[Static] = None
+        self._top_divider_date = None
+        # Follow the conversation only while the user is pinned to the
+        # bottom; a reader scrolled up shouldn't be yanked down by new
+        # messages, and a burst should trigger at most one scroll pass
+        self._at_bottom = True
+        self._scroll_scheduled = False
 
     def compose(self) -> ComposeResult:
         yield Static("Select a conversation to start chatting", classes="centered-text empty-chat-message")
 
-    def set_messages(self, messages: list[Message], conversation_id: Optional[str] = None) -> None:
-        """Update displayed messages (limited to most recent MAX_MESSAGES)."""
-        # Only show the most recent messages
-        display_messages = messages[-self.MAX_MESSAGES:] if len(messages) > self.MAX_MESSAGES else messages
-        self.messages = display_messages
-        self.conversation_id = conversation_id
-
-        # Clear existing
-        self.query("*").remove()
+    def _build_widgets(self, messages) -> tuple[list, Optional[Static], object]:
+        """Build bubbles plus date dividers for a run of messages.
 
-        if not display_messages:
-            self.mount(Static("No messages yet. Send one!", classes="centered-text empty-chat-message"))
-            return
-
-        # Build all widgets first for batch mounting
+        Returns the widgets along with the first divider and its date so
+        the caller can track (or deduplicate) the window's top divider.
+        """
         widgets = []
+        first_divider = None
+        first_divider_date = None
         current_date = None
-        for msg in display_messages:
-            msg_date = msg.timestamp.date()
+        today = datetime.now().date()  # hoisted: constant for the loop
+        for msg in messages:
+            ts = msg.timestamp_dt
+            msg_date = ts.date()
             if msg_date != current_date:
                 current_date = msg_date
-                if msg_date == datetime.now().date():
+                if msg_date == today:
                     date_str = "Today"
                 else:
-                    date_str = msg_date.strftime("%B %d, %Y")
-                widgets.append(Static(f"─── {date_str} ───", classes="date-divider"))
+                    date_str = msg_date.strftime(_DATE_FMT)
+                divider = Static(f"─── {date_str} ───", classes="date-divider")
+                if first_divider is None:
+                    first_divider = divider
+                    first_divider_date = msg_date
+                widgets.append(divider)
 
             bubble = MessageBubble(
                 msg.display_sender,
                 msg.body,
-                msg.timestamp.strftime("%I:%M %p"),
+                _fmt_time(ts.hour, ts.minute),
                 msg.is_outgoing,
                 msg.attachments
             )
             widgets.append(bubble)
+        return widgets, first_divider, first_divider_date
+
+    def set_messages(self, messages, conversation_id: Optional[str] = None) -> None:
+        """Update displayed messages (limited to most recent MAX_MESSAGES).
+
+        Accepts any sequence of Messages, including the bounded deques the
+        app keeps per conversation. Only the newest INITIAL_WINDOW get
+        widgets immediately; older ones are mounted on demand.
+        """
+        # Only show the most recent messages
+        if len(messages) > self.MAX_MESSAGES:
+            # deque(..., maxlen) keeps the tail in one C-level pass and
+            # works for deque inputs, which don't support slicing
+            display_messages = list(deque(messages, maxlen=self.MAX_MESSAGES))
+        else:
+            display_messages = list(messages)
+        self.messages = display_messages
+        self.conversation_id = conversation_id
+
+        # Clear existing
+        self.query("*").remove()
+        self._top_divider = None
+        self._top_divider_date = None
+
+        if not display_messages:
+            self._mounted_from = 0
+            self.mount(Static("No messages yet. Send one!", classes="centered-text empty-chat-message"))
+            return
+
+        # Mount only the visible window; the rest stays virtual
+        self._mounted_from = max(0, len(display_messages) - self.INITIAL_WINDOW)
+        widgets, divider, divider_date = self._build_widgets(
+            display_messages[self._mounted_from:]
+        )
+        self._top_divider = divider
+        self._top_divider_date = divider_date
 
         # Mount all widgets at once for better performance
         self.mount_all(widgets)
 
         # Scroll to bottom after layout completes
+        self._at_bottom = True
         self.set_timer(0.1, lambda: self.scroll_end(animate=False))
 
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Mount the next step of older bubbles when nearing the top."""
+        super().watch_scroll_y(old_value, new_value)
+        self._at_bottom = self.max_scroll_y - new_value <= 1
+        if new_value <= self.NEAR_TOP and self._mounted_from > 0:
+            self._mount_more_above()
+
+    def _mount_more_above(self) -> None:
+        """Materialize the next WINDOW_STEP older messages as widgets."""
+        new_from = max(0, self._mounted_from - self.WINDOW_STEP)
+        chunk = self.messages[new_from:self._mounted_from]
+        if not chunk:
+            return
+        self._mounted_from = new_from
+
+        widgets, divider, divider_date = self._build_widgets(chunk)
+        # The old top divider repeats the prepended chunk's last date;
+        # drop it so each date appears once
+        if (
+            self._top_divider is not None
+            and chunk[-1].timestamp_dt.date() == self._top_divider_date
+        ):
+            self._top_divider.remove()
+        if divider is not None:
+            self._top_divider = divider
+            self._top_divider_date = divider_date
+        for widget in reversed(widgets):
+            self.mount(widget, before=0)
+
     def add_message(self, msg: Message) -> None:
         """Add a single new message."""
         # Remove "no messages" placeholder if present
         for placeholder in self.query(".empty-chat-message"):
             placeholder.remove()
 
+        self.messages.append(msg)
+        ts = msg.timestamp_dt
         bubble = MessageBubble(
             msg.display_sender,
             msg.body,
-            msg.timestamp.strftime("%I:%M %p"),
+            _fmt_time(ts.hour, ts.minute),
             msg.is_outgoing,
             msg.attachments
         )
         self.mount(bubble)
 
-        # Scroll to bottom after layout completes
-        self.call_after_refresh(lambda: self.scroll_end(animate=False))
+        # Keep following only if pinned to the bottom, and schedule one
+        # scroll per refresh even when a burst of messages arrives
+        if self._at_bottom and not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.call_after_refresh(self._scroll_to_end)
 
+    def _scroll_to_end(self) -> None:
+        self._scroll_scheduled = False
+        self.scroll_end(animate=False)
 
 # ============================================================================
 # Main Application
@@ -975,6 +1395,9 @@ class SignalTUI(App):
     ]
 
     TITLE = "Signal TUI"
+    # Per-conversation in-memory message cap; older entries age out and
+    # are reloaded from the message store on demand
+    CONVERSATION_CACHE_CAP = 500
     SUB_TITLE = "Terminal Client for Signal Messenger"
 
     def __init__(self):
@@ -989,10 +1412,17 @@ class SignalTUI(App):
         self.current_contact: Optional[str] = None
         self.current_contact_name: str = ""
         self.current_is_group: bool = False
-        self.conversations: dict[str, list[Message]] = {}
+        # Bounded per-contact deques: old entries fall off the left instead
+        # of the cache (and each render) growing with the full history
+        self.conversations: dict[str, deque[Message]] = {}
         self.last_message_times: dict[str, datetime] = {}
-        self._receive_task: Optional[asyncio.Task] = None
+        self._receiver_started = False
         self.staged_attachment: Optional[StagedAttachment] = None
+        self._search_timer = None  # Pending debounced search, if any
+        # Incoming-message toasts aggregated per sender; flushed as one
+        # notification once the burst window passes
+        self._pending_notifications: dict[str, int] = {}
+        self._notify_timer = None
 
         # Initialize message store for persistence
         self.message_store = MessageStore(Path(self.config.messages_db_path))
@@ -1031,8 +1461,20 @@ class SignalTUI(App):
 
     def on_mount(self) -> None:
         """Initialize the app on mount - renders UI immediately, loads data async."""
+        # Resolve the fixed main-screen widgets once; these ids are hit on
+        # every keystroke and incoming message, and a CSS query walks the
+        # DOM each time
+        self._w_contacts_list = self.query_one("#contacts-list", ContactsList)
+        self._w_messages = self.query_one("#messages-container", ChatMessages)
+        self._w_status_bar = self.query_one("#status-bar", StatusBar)
+        self._w_search_box = self.query_one("#search-box", Input)
+        self._w_message_input = self.query_one("#message-input", MessageInput)
+        self._w_chat_header_name = self.query_one("#chat-header-name", Static)
+        self._w_chat_header_status = self.query_one("#chat-header-status", Static)
+        self._w_attachment = self.query_one("#attachment-indicator", AttachmentIndicator)
+
         # Set phone number from config (fast, no subprocess)
-        status_bar = self.query_one("#status-bar", StatusBar)
+        status_bar = self._w_status_bar
         status_bar.phone_number = self.config.phone_number
 
         # Check if setup is needed
@@ -1052,7 +1494,7 @@ class SignalTUI(App):
 
     async def _async_init(self) -> None:
         """Async initialization - fetches version, verifies account, loads contacts."""
-        status_bar = self.query_one("#status-bar", StatusBar)
+        status_bar = self._w_status_bar
 
         # Get version (runs in thread to not block)
         version = await asyncio.to_thread(self.signal_client.get_version)
@@ -1064,8 +1506,8 @@ class SignalTUI(App):
         status_bar.connected = connected
 
         if connected:
-            # Load contacts in background (will update cache and UI)
-            self.load_contacts()
+            # Load contacts (will update cache and UI)
+            await self.load_contacts()
             self.start_message_receiver()
             self.notify("Connected to Signal!", severity="information")
             # Start auto-import from Signal Desktop after a short delay
@@ -1083,7 +1525,7 @@ class SignalTUI(App):
         self.signal_client.phone_number = self.config.phone_number
 
         # Update status bar with loading state
-        status_bar = self.query_one("#status-bar", StatusBar)
+        status_bar = self._w_status_bar
         status_bar.phone_number = self.config.phone_number
         status_bar.connecting = True
         status_bar.version = "..."
@@ -1099,20 +1541,52 @@ class SignalTUI(App):
         # Run async initialization in background worker
         self.run_worker(self._async_init(), exclusive=True)
 
-    def load_contacts(self) -> None:
-        """Load contacts - from cache first for instant display, then refresh in background."""
-        # First, try to load from cache for instant display
-        if self.message_store.has_contact_cache():
-            cached_contacts = self.message_store.get_contacts()
-            cached_groups = self.message_store.get_groups()
+    async def load_contacts(self, refresh: bool = False) -> None:
+        """Load contacts - from cache first for instant display, then refresh.
+
+        Runs as a coroutine worker: the blocking store and signal-cli
+        calls go through asyncio.to_thread while the UI updates happen
+        directly on the event loop, so there's no dedicated OS thread and
+        no call_from_thread marshalling hop per refresh.
+
+        With refresh, the client's in-process contact cache is bypassed so
+        renames and newly added contacts show up even when signal-cli
+        never pushed a contactsUpdated notification.
+        """
+        # Cache read off the loop so it can't stall the first paint
+        if await asyncio.to_thread(self.message_store.has_contact_cache):
+            cached_contacts = await asyncio.to_thread(self.message_store.get_contacts)
+            cached_groups = await asyncio.to_thread(self.message_store.get_groups)
             if cached_contacts or cached_groups:
                 contact_list = self._build_contact_list(cached_contacts, cached_groups, from_cache=True)
                 self._update_contacts_ui(contact_list)
 
-        # Then refresh from signal-cli in background
-        import threading
-        thread = threading.Thread(target=self._load_contacts_thread, daemon=True)
-        thread.start()
+        # Then refresh from signal-cli
+        try:
+            contacts = await asyncio.to_thread(self.signal_client.list_contacts, refresh)
+            groups = await asyncio.to_thread(self.signal_client.list_groups)
+
+            # Convert Contact objects to dicts for caching
+            contacts_for_cache = []
+            for contact in contacts:
+                contacts_for_cache.append({
+                    "number": contact.number,
+                    "name": contact.name,
+                    "givenName": contact.profile_name,
+                    "uuid": contact.uuid,
+                    "isBlocked": contact.is_blocked,
+                })
+
+            # Save to encrypted database cache
+            await asyncio.to_thread(self.message_store.save_contacts, contacts_for_cache)
+            await asyncio.to_thread(self.message_store.save_groups, groups)
+
+            # Build contact list and update UI (already on the loop)
+            contact_list = self._build_contact_list(contacts, groups, from_cache=False)
+            self._update_contacts_ui(contact_list)
+
+        except Exception as e:
+            self.notify(f"Failed to load contacts: {e}", severity="error")
 
     def _build_contact_list(self, contacts, groups, from_cache: bool = False) -> list:
         """Build contact list for UI from contacts and groups data."""
@@ -1142,9 +1616,9 @@ class SignalTUI(App):
                     last_dt = datetime.fromtimestamp(stored.last_message_at / 1000)
                     self.last_message_times[number] = last_dt
                     if last_dt.date() == datetime.now().date():
-                        last_time = last_dt.strftime("%I:%M %p")
+                        last_time = last_dt.strftime(_TIME_FMT)
                     else:
-                        last_time = last_dt.strftime("%b %d")
+                        last_time = last_dt.strftime(_SHORT_DATE_FMT)
 
                 contact_list.append((
                     number,
@@ -1167,9 +1641,9 @@ class SignalTUI(App):
                     last_dt = datetime.fromtimestamp(stored.last_message_at / 1000)
                     self.last_message_times[number] = last_dt
                     if last_dt.date() == datetime.now().date():
-                        last_time = last_dt.strftime("%I:%M %p")
+                        last_time = last_dt.strftime(_TIME_FMT)
                     else:
-                        last_time = last_dt.strftime("%b %d")
+                        last_time = last_dt.strftime(_SHORT_DATE_FMT)
 
                 contact_list.append((
                     number,
@@ -1193,9 +1667,9 @@ class SignalTUI(App):
                 last_dt = datetime.fromtimestamp(stored.last_message_at / 1000)
                 self.last_message_times[group_id] = last_dt
                 if last_dt.date() == datetime.now().date():
-                    last_time = last_dt.strftime("%I:%M %p")
+                    last_time = last_dt.strftime(_TIME_FMT)
                 else:
-                    last_time = last_dt.strftime("%b %d")
+                    last_time = last_dt.strftime(_SHORT_DATE_FMT)
 
             contact_list.append((
                 group_id,
@@ -1224,44 +1698,17 @@ class SignalTUI(App):
 
         return contact_list
 
-    def _load_contacts_thread(self) -> None:
-        """Background thread to load contacts from signal-cli and update cache."""
-        try:
-            contacts = self.signal_client.list_contacts()
-            groups = self.signal_client.list_groups()
-
-            # Convert Contact objects to dicts for caching
-            contacts_for_cache = []
-            for contact in contacts:
-                contacts_for_cache.append({
-                    "number": contact.number,
-                    "name": contact.name,
-                    "givenName": contact.profile_name,
-                    "uuid": contact.uuid,
-                    "isBlocked": contact.is_blocked,
-                })
-
-            # Save to encrypted database cache
-            self.message_store.save_contacts(contacts_for_cache)
-            self.message_store.save_groups(groups)
-
-            # Build contact list for UI
-            contact_list = self._build_contact_list(contacts, groups, from_cache=False)
-
-            # Update UI from thread using call_from_thread
-            self.call_from_thread(self._update_contacts_ui, contact_list)
-
-        except Exception as e:
-            self.call_from_thread(self.notify, f"Failed to load contacts: {e}", severity="error")
-
     def _update_contacts_ui(self, contacts: list) -> None:
         """Update contacts list UI."""
-        contacts_list = self.query_one("#contacts-list", ContactsList)
-        contacts_list.set_contacts(contacts)
+        # One compositor pass for the sidebar rebuild plus the status
+        # change, instead of painting after each
+        with self.batch_update():
+            contacts_list = self._w_contacts_list
+            contacts_list.set_contacts(contacts)
 
-        # Update status
-        status = self.query_one("#status-bar", StatusBar)
-        status.connected = True
+            # Update status
+            status = self._w_status_bar
+            status.connected = True
 
     def _resort_contacts(self) -> None:
         """Re-sort the contact list based on last message times."""
@@ -1273,50 +1720,94 @@ class SignalTUI(App):
                 self._update_contacts_ui(contact_list)
 
     def start_message_receiver(self) -> None:
-        """Start background message receiver thread."""
-        if self._receive_task is None:
-            import threading
-            self._running = True
-            self._receive_task = threading.Thread(target=self._receive_loop_thread, daemon=True)
-            self._receive_task.start()
-
-    def _receive_loop_thread(self) -> None:
-        """Background thread to receive messages."""
-        import time
-        while getattr(self, '_running', True):
-            try:
-                messages = self.signal_client.receive_messages(timeout=10)
-                for msg in messages:
-                    self.call_from_thread(self._handle_incoming_message, msg)
-            except Exception as e:
-                # Don't spam notifications for receive errors
-                pass
-            time.sleep(1)
+        """Start receiving messages.
+
+        Delegates to the client's receive daemon: in JSON-RPC daemon mode
+        messages are pushed over the socket with no polling or per-call
+        process spawn; without a daemon the client falls back to its own
+        streaming receive loop. Either way this app just gets callbacks.
+        """
+        if self._receiver_started:
+            return
+        self._receiver_started = True
+        self._running = True
+        self.signal_client.start_receive_daemon(self._on_message_received)
+
+    def _on_message_received(self, msg: Message) -> None:
+        """Hand a received message to the UI thread."""
+        if self._running:
+            self.call_from_thread(self._handle_incoming_message, msg)
 
     def _handle_incoming_message(self, msg: Message) -> None:
         """Handle an incoming message (called from main thread via call_from_thread)."""
         # Store in conversations
         contact_id = msg.group_id if msg.group_id else msg.sender
         if contact_id not in self.conversations:
-            self.conversations[contact_id] = []
+            self.conversations[contact_id] = deque(maxlen=self.CONVERSATION_CACHE_CAP)
         self.conversations[contact_id].append(msg)
 
         # Track last message time for sorting
-        self.last_message_times[contact_id] = msg.timestamp
+        self.last_message_times[contact_id] = msg.timestamp_dt
 
         # Persist message to database
         self.message_store.save_message(msg, contact_id)
 
-        # Re-sort contact list to move this contact to top
-        self._resort_contacts()
-
-        # If this is the current conversation, update UI
-        if contact_id == self.current_contact:
-            messages_container = self.query_one("#messages-container", ChatMessages)
-            messages_container.add_message(msg)
-
-        # Show notification
-        self.notify(f"New message from {msg.display_sender}")
+        # Batch the sidebar update, new bubble and toast into one paint
+        with self.batch_update():
+            # Bump just this contact's row to the top; only unknown
+            # senders (first contact ever) need the full rebuild
+            last_dt = msg.timestamp_dt
+            if last_dt.date() == datetime.now().date():
+                time_str = _fmt_time(last_dt.hour, last_dt.minute)
+            else:
+                time_str = last_dt.strftime(_SHORT_DATE_FMT)
+            contacts_list = self._w_contacts_list
+            updated = contacts_list.update_contact(
+                contact_id,
+                last_message=msg.body,
+                time=time_str,
+                unread_delta=0 if contact_id == self.current_contact else 1,
+                timestamp=int(last_dt.timestamp() * 1000),
+            )
+            if not updated:
+                self._resort_contacts()
+
+            # If this is the current conversation, update UI
+            if contact_id == self.current_contact:
+                messages_container = self._w_messages
+                messages_container.add_message(msg)
+
+            # Queue the toast; a sync burst collapses into one
+            # aggregated notification instead of a toast per message
+            self._queue_notification(msg.display_sender)
+
+    NOTIFY_WINDOW = 0.5  # seconds; bursts within this show one toast
+
+    def _queue_notification(self, sender: str) -> None:
+        """Count the sender's new message and (re-)arm the flush timer."""
+        pending = self._pending_notifications
+        pending[sender] = pending.get(sender, 0) + 1
+        if self._notify_timer is not None:
+            self._notify_timer.stop()
+        self._notify_timer = self.set_timer(self.NOTIFY_WINDOW, self._flush_notifications)
+
+    def _flush_notifications(self) -> None:
+        """Emit one toast summarizing everything queued in the window."""
+        pending = self._pending_notifications
+        self._pending_notifications = {}
+        self._notify_timer = None
+        if not pending:
+            return
+        if len(pending) == 1:
+            sender, count = next(iter(pending.items()))
+            if count == 1:
+                self.notify(f"New message from {sender}")
+            else:
+                self.notify(f"{count} new messages from {sender}")
+        else:
+            total = sum(pending.values())
+            parts = ", ".join(f"{count} from {sender}" for sender, count in pending.items())
+            self.notify(f"{total} new messages: {parts}")
 
     def on_message_input_image_pasted(self, event: MessageInput.ImagePasted) -> None:
         """Handle image pasted from clipboard."""
@@ -1325,14 +1816,29 @@ class SignalTUI(App):
             cleanup_temp_attachment(self.staged_attachment)
 
         self.staged_attachment = event.attachment
-        self.query_one("#attachment-indicator", AttachmentIndicator).set_attachment(event.attachment)
+        self._w_attachment.set_attachment(event.attachment)
         self.notify(f"Image staged: {event.attachment.filename}", severity="information")
 
+    SEARCH_DEBOUNCE = 0.1  # seconds; coalesces bursts of keystrokes
+
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input changes - used for search filtering."""
         if event.input.id == "search-box":
-            contacts_list = self.query_one("#contacts-list", ContactsList)
-            contacts_list.filter_contacts(event.value)
+            # Debounce: re-filtering and re-rendering the sidebar per
+            # keystroke stalls fast typists, so let the burst settle and
+            # run the filter once with the final text
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            value = event.value
+            self._search_timer = self.set_timer(
+                self.SEARCH_DEBOUNCE, lambda: self._apply_search(value)
+            )
+
+    def _apply_search(self, value: str) -> None:
+        """Run the contact filter after the debounce interval."""
+        self._search_timer = None
+        contacts_list = self._w_contacts_list
+        contacts_list.filter_contacts(value)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle message submission."""
@@ -1361,16 +1867,14 @@ class SignalTUI(App):
             if self.staged_attachment:
                 attachment_path = self.staged_attachment.path
                 self.staged_attachment = None
-                self.query_one("#attachment-indicator", AttachmentIndicator).set_attachment(None)
-
-            # Send message in background thread
-            import threading
-            thread = threading.Thread(
-                target=self._send_message_thread,
-                args=(message_text, attachment_path),
-                daemon=True
+                self._w_attachment.set_attachment(None)
+
+            # Send message on a background worker
+            self.run_worker(
+                partial(self._send_message_thread, message_text, attachment_path),
+                thread=True,
+                exclusive=False,
             )
-            thread.start()
 
     def _send_message_thread(self, text: str, attachment_path: Optional[str] = None) -> None:
         """Send a message in a background thread."""
@@ -1409,11 +1913,11 @@ class SignalTUI(App):
             )
 
             if self.current_contact not in self.conversations:
-                self.conversations[self.current_contact] = []
+                self.conversations[self.current_contact] = deque(maxlen=self.CONVERSATION_CACHE_CAP)
             self.conversations[self.current_contact].append(msg)
 
             # Track last message time for sorting
-            self.last_message_times[self.current_contact] = msg.timestamp
+            self.last_message_times[self.current_contact] = msg.timestamp_dt
 
             # Persist message to database
             self.message_store.save_message(msg, self.current_contact)
@@ -1424,8 +1928,6 @@ class SignalTUI(App):
 
             # Clean up temp attachment file
             if attachment_path:
-                import tempfile
-                import os
                 temp_dir = tempfile.gettempdir()
                 if attachment_path.startswith(temp_dir) and os.path.exists(attachment_path):
                     try:
@@ -1441,12 +1943,14 @@ class SignalTUI(App):
 
     def _add_sent_message(self, msg: Message) -> None:
         """Add a sent message to the UI."""
-        messages_container = self.query_one("#messages-container", ChatMessages)
+        messages_container = self._w_messages
         messages_container.add_message(msg)
 
     def action_quit(self) -> None:
         """Quit the application."""
         self._running = False  # Signal receive thread to stop
+        # Stop callbacks and shut down the signal-cli daemon, if any
+        self.signal_client.stop_receive_daemon()
         # Clean up any staged attachment
         if self.staged_attachment:
             cleanup_temp_attachment(self.staged_attachment)
@@ -1460,37 +1964,37 @@ class SignalTUI(App):
         if self.staged_attachment:
             cleanup_temp_attachment(self.staged_attachment)
             self.staged_attachment = None
-            self.query_one("#attachment-indicator", AttachmentIndicator).set_attachment(None)
+            self._w_attachment.set_attachment(None)
             self.notify("Attachment removed", severity="information")
 
     def action_new_chat(self) -> None:
         """Start a new chat."""
         self.notify("New chat: Enter phone number in search box", title="New Chat")
-        self.query_one("#search-box", Input).focus()
+        self._w_search_box.focus()
 
     def action_search(self) -> None:
         """Focus search box."""
-        self.query_one("#search-box", Input).focus()
+        self._w_search_box.focus()
 
     def action_focus_input(self) -> None:
         """Focus message input."""
-        self.query_one("#message-input", Input).focus()
+        self._w_message_input.focus()
 
     def action_prev_contact(self) -> None:
         """Select previous contact."""
-        contacts_list = self.query_one("#contacts-list", ContactsList)
+        contacts_list = self._w_contacts_list
         new_index = max(0, contacts_list.selected_index - 1)
         contacts_list.select_contact(new_index)
 
     def action_next_contact(self) -> None:
         """Select next contact."""
-        contacts_list = self.query_one("#contacts-list", ContactsList)
+        contacts_list = self._w_contacts_list
         new_index = min(len(contacts_list.filtered_contacts) - 1, contacts_list.selected_index + 1)
         contacts_list.select_contact(new_index)
 
     def action_select_contact(self) -> None:
         """Select the highlighted contact and open conversation."""
-        contacts_list = self.query_one("#contacts-list", ContactsList)
+        contacts_list = self._w_contacts_list
         contact = contacts_list.get_selected_contact()
         if contact:
             self.open_conversation(contact[0], contact[1], contact[5])
@@ -1505,26 +2009,29 @@ class SignalTUI(App):
         if self.staged_attachment:
             cleanup_temp_attachment(self.staged_attachment)
             self.staged_attachment = None
-            self.query_one("#attachment-indicator", AttachmentIndicator).set_attachment(None)
+            self._w_attachment.set_attachment(None)
 
         # Update header immediately
-        self.query_one("#chat-header-name", Static).update(name)
+        self._w_chat_header_name.update(name)
         status = "group" if is_group else "direct message"
-        self.query_one("#chat-header-status", Static).update(f"● {status}")
+        self._w_chat_header_status.update(f"● {status}")
+
+        # Clear the unread badge for the conversation being opened
+        self._w_contacts_list.update_contact(contact_id, unread=0)
 
         # Clear messages and show loading state
-        messages_container = self.query_one("#messages-container", ChatMessages)
+        messages_container = self._w_messages
         messages_container.set_messages([], conversation_id=contact_id)
 
         # Focus input immediately
-        self.query_one("#message-input", Input).focus()
+        self._w_message_input.focus()
 
-        # Load messages in background thread to avoid blocking UI
-        threading.Thread(
-            target=self._load_conversation_messages,
-            args=(contact_id,),
-            daemon=True
-        ).start()
+        # Load messages on a background worker to avoid blocking UI
+        self.run_worker(
+            partial(self._load_conversation_messages, contact_id),
+            thread=True,
+            exclusive=False,
+        )
 
     def _load_conversation_messages(self, contact_id: str) -> None:
         """Load conversation messages in background thread."""
@@ -1558,30 +2065,31 @@ class SignalTUI(App):
         merged = []
 
         for msg in db_messages:
-            key = (int(msg.timestamp.timestamp()), msg.sender, msg.body)
+            key = (int(msg.timestamp_dt.timestamp()), msg.sender, msg.body)
             if key not in seen:
                 seen.add(key)
                 merged.append(msg)
 
         for msg in in_memory:
-            key = (int(msg.timestamp.timestamp()), msg.sender, msg.body)
+            key = (int(msg.timestamp_dt.timestamp()), msg.sender, msg.body)
             if key not in seen:
                 seen.add(key)
                 merged.append(msg)
 
         # Sort by timestamp
-        merged.sort(key=lambda m: m.timestamp)
+        merged.sort(key=lambda m: m.timestamp_dt)
 
-        # Update in-memory cache
-        self.conversations[contact_id] = merged
+        # Update in-memory cache (bounded; keeps the newest entries)
+        self.conversations[contact_id] = deque(merged, maxlen=self.CONVERSATION_CACHE_CAP)
 
         # Update UI
-        messages_container = self.query_one("#messages-container", ChatMessages)
+        messages_container = self._w_messages
         messages_container.set_messages(merged, conversation_id=contact_id)
 
     def action_refresh(self) -> None:
         """Refresh contacts and messages."""
-        self.load_contacts()
+        # User asked for a refresh: force a full re-fetch from signal-cli
+        self.run_worker(self.load_contacts(refresh=True), exclusive=True)
         self.notify("Refreshing...")
 
     def action_setup(self) -> None:
@@ -1610,10 +2118,8 @@ class SignalTUI(App):
         """Start importing messages from Signal Desktop."""
         self.notify("Starting Signal Desktop import...", severity="information")
 
-        # Run import in background thread
-        import threading
-        thread = threading.Thread(target=self._do_desktop_import, daemon=True)
-        thread.start()
+        # Run import on a background worker
+        self.run_worker(self._do_desktop_import, thread=True, exclusive=False)
 
     def _do_desktop_import(self, silent: bool = False) -> None:
         """Background thread to import from Signal Desktop.
@@ -1698,14 +2204,12 @@ class SignalTUI(App):
         except ImportError:
             return
 
-        # Run import in background thread (silent mode)
-        import threading
-        thread = threading.Thread(
-            target=self._do_desktop_import,
-            args=(True,),  # silent=True
-            daemon=True
+        # Run import on a background worker (silent mode)
+        self.run_worker(
+            partial(self._do_desktop_import, True),  # silent=True
+            thread=True,
+            exclusive=False,
         )
-        thread.start()
 
     def _show_stats(self) -> None:
         """Show message store statistics."""